@@ -0,0 +1,71 @@
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from ueloctool.api.formats.locres.version import LocresVersion
+from ueloctool.benchmark import (
+    find_regressions,
+    generate_locres,
+    load_baseline,
+    measure_import_time,
+    run_benchmark,
+)
+from ueloctool.main import app
+
+# Absolute timings only mean something against a baseline recorded on the same
+# machine with the same parameters, so these tests run only when given one:
+#   ueloctool benchmark --namespaces 5 --keys 400 --repeat 5 \
+#       --baseline baseline.json --save-baseline
+#   UELOCTOOL_BENCHMARK_BASELINE=baseline.json pytest tests/test_benchmark.py
+BASELINE_FILE = os.environ.get("UELOCTOOL_BENCHMARK_BASELINE")
+PARAMETERS = {"namespaces": 5, "keys": 400, "duplicate_ratio": 0.2, "utf16_ratio": 0.1}
+REPEAT = 5
+
+# Timings on shared machines easily vary 2x between runs, dedicated ones can
+# tighten this
+TOLERANCE = float(os.environ.get("UELOCTOOL_BENCHMARK_TOLERANCE", 1.5))
+
+
+@pytest.fixture(scope="module")
+def baseline() -> dict[str, dict[str, float]]:
+    if not BASELINE_FILE:
+        pytest.skip("UELOCTOOL_BENCHMARK_BASELINE is not set.")
+
+    return load_baseline(Path(BASELINE_FILE), PARAMETERS)
+
+
+@pytest.mark.parametrize("version", LocresVersion, ids=lambda version: version.name)
+def test_generate_locres(version):
+    locres = generate_locres(version, namespaces=3, keys=100, utf16_ratio=0.5)
+    stats = locres.get_stats()
+
+    assert locres.version == version
+    assert stats["namespaces"] == 3
+    assert stats["keys"] == 300
+    assert stats["unique_strings"] < 300  # Some strings are duplicates
+    assert any(not locres.get(key).isascii() for key in locres.keys())
+
+    # The same seed gives the same file
+    assert list(locres.keys()) == list(generate_locres(version, 3, 100).keys())
+
+
+@pytest.mark.parametrize("version", LocresVersion, ids=lambda version: version.name)
+def test_handler_operations(baseline, version):
+    results = run_benchmark(version, **PARAMETERS, repeat=REPEAT)
+
+    assert results.keys() == baseline[version.name].keys()
+    assert find_regressions(results, baseline[version.name], TOLERANCE) == []
+
+
+def test_startup(baseline):
+    results = {"import": measure_import_time(repeat=REPEAT)}
+
+    assert find_regressions(results, baseline["startup"], TOLERANCE) == []
+
+
+def test_rejects_unknown_versions():
+    result = CliRunner().invoke(app, ["benchmark", "--version", "OPTIMISED"])
+
+    assert result.exit_code == 2
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pytest
+
+from ueloctool.api.formats.locres.diff import Changeset, diff_locres, iter_prefill
+from ueloctool.api.formats.locres.hashing import StrCrc32
+from ueloctool.api.formats.locres.main import LocresFile
+from ueloctool.api.formats.locres.reader import LocresReader
+from ueloctool.api.formats.locres.version import LocresVersion
+
+OLD_SOURCE = {"Game::A": "Alpha", "Game::B": "Beta", "UI::C": "Gamma"}
+NEW_SOURCE = {"Game::A": "Alpha", "Game::B": "Beta!", "UI::D": "Delta"}
+TRANSLATIONS = {"Game::A": "Alfa", "Game::B": "Beta-pl", "UI::C": "Gamma-pl"}
+
+
+def write_locres(
+    locres_file: Path,
+    version: LocresVersion,
+    strings: dict[str, str],
+    source: dict[str, str] | None = None,
+):
+    # Translated files store the hash of the source string, not of their own value
+    locres = LocresFile.new(version)
+
+    for key, value in strings.items():
+        namespace, name = key.split("::")
+        value_hash = StrCrc32(source[key]) if source else None
+        locres.add_string(namespace, name, value, value_hash=value_hash)
+
+    locres.save(locres_file)
+
+
+@pytest.mark.parametrize("version", LocresVersion, ids=lambda version: version.name)
+def test_diff_and_prefill(tmp_path, version):
+    write_locres(tmp_path / "old.locres", version, OLD_SOURCE)
+    write_locres(tmp_path / "new.locres", version, NEW_SOURCE)
+    write_locres(tmp_path / "pl.locres", version, TRANSLATIONS, OLD_SOURCE)
+
+    with (
+        open(tmp_path / "old.locres", "rb") as old_handle,
+        open(tmp_path / "new.locres", "rb") as new_handle,
+        open(tmp_path / "pl.locres", "rb") as translated_handle,
+        LocresReader(old_handle) as old,
+        LocresReader(new_handle) as new,
+        LocresReader(translated_handle) as translated,
+    ):
+        changeset = diff_locres(old, new)
+
+        assert changeset == Changeset(
+            added=["UI::D"], removed=["UI::C"], changed=["Game::B"]
+        )
+        assert diff_locres(old, old) == Changeset()
+
+        # Only the translation of the unchanged string can be reused
+        assert list(iter_prefill(changeset, translated)) == [("Game::A", "Alfa")]
+
+
+def test_changeset_round_trip(tmp_path):
+    changeset = Changeset(added=["UI::D"], removed=["UI::C"], changed=["Game::B"])
+    changeset.save(tmp_path / "changes.json")
+
+    assert Changeset.load(tmp_path / "changes.json") == changeset
@@ -0,0 +1,119 @@
+import time
+from zlib import crc32
+
+import pytest
+from cityhash import CityHash64
+
+from ueloctool.api.formats.locres.hashing import (
+    CityHash64UTF16,
+    HashNamespace,
+    StrCrc32,
+    get_hash_function,
+)
+from ueloctool.api.formats.locres.version import LocresVersion
+
+# Regression pins, recorded from our own StrCrc32 and CityHash64UTF16 and not
+# taken from the engine. StrCrc32 is checked against a port of the engine loop
+# below, CityHash64UTF16 only for the empty string.
+KNOWN_HASHES = [
+    ("", 0x00000000, 0x19D0CB9C),
+    ("Game", 0xCBDDD7E6, 0xBB14C875),
+    ("UI", 0x9EF8357C, 0x3F910C73),
+    ("ST_MainMenu", 0xF88D89D8, 0xA5B7BE73),
+    ("Key0", 0x6BDBFF10, 0x66FC44DC),
+    ("8A2F4D1C4E7B9A0D", 0x0ACD3FC4, 0x29D0A40D),
+    ("New Game", 0x3175A0D6, 0x4D7CF09A),
+    ("Zażółć gęślą jaźń", 0x5C44C0A1, 0xA15659CA),
+    ("日本語", 0xDB95855E, 0xCF37C9CE),
+    ("😀 emoji 𝄞", 0x21D72481, 0x0D7227BC),
+    ("\uffff", 0x41D9ED00, 0xED3930BD),
+]
+
+CRC_TABLE = []
+
+for index in range(256):
+    value = index
+
+    for _ in range(8):
+        value = (value >> 1) ^ 0xEDB88320 if value & 1 else value >> 1
+
+    CRC_TABLE.append(value)
+
+
+def ReferenceStrCrc32(string: str) -> int:
+    # Literal port of FCrc::StrCrc32, every UTF-16 code unit is fed as 4 bytes
+    crc = 0xFFFFFFFF
+    data = string.encode("utf-16-le")
+
+    for offset in range(0, len(data), 2):
+        char = int.from_bytes(data[offset : offset + 2], "little")
+
+        for _ in range(4):
+            crc = (crc >> 8) ^ CRC_TABLE[(crc ^ char) & 0xFF]
+            char >>= 8
+
+    return crc ^ 0xFFFFFFFF
+
+
+@pytest.mark.parametrize("string, crc, city", KNOWN_HASHES)
+def test_known_hashes(string, crc, city):
+    assert StrCrc32(string) == crc
+    assert CityHash64UTF16(string) == city
+
+
+@pytest.mark.parametrize("string", [string for string, _, _ in KNOWN_HASHES])
+def test_str_crc32_matches_engine_loop(string):
+    assert StrCrc32(string) == ReferenceStrCrc32(string)
+
+
+def test_empty_string_city_hash():
+    # CityHash64 of no data is the k2 constant, folded by GetTypeHash(uint64)
+    assert CityHash64(b"") == 0x9AE16A3B2F90404F
+    assert CityHash64UTF16("") == (0x2F90404F + 0x9AE16A3B * 23) & 0xFFFFFFFF
+
+
+def test_hash_functions_by_version():
+    assert get_hash_function(LocresVersion.OPTIMIZED) is StrCrc32
+    assert get_hash_function(LocresVersion.OPTIMIZED_CITYHASH64_UTF16) is (
+        CityHash64UTF16
+    )
+
+    for version in (LocresVersion.LEGACY, LocresVersion.COMPACT):
+        assert get_hash_function(version)("Key") == 0
+
+
+def test_namespace_hashes_are_memoized():
+    HashNamespace.cache_clear()
+
+    for _ in range(3):
+        assert HashNamespace("Game", LocresVersion.OPTIMIZED) == StrCrc32("Game")
+
+    assert HashNamespace.cache_info().hits == 2
+
+
+@pytest.mark.parametrize(
+    "hash_string, primitive",
+    [
+        (StrCrc32, lambda string: crc32(string.encode("utf-32-le"))),
+        (CityHash64UTF16, lambda string: CityHash64(string.encode("utf-16-le"))),
+    ],
+    ids=["StrCrc32", "CityHash64UTF16"],
+)
+def test_hash_throughput(hash_string, primitive):
+    # Compared to the bare hash primitive, so it doesn't depend on the machine
+    keys = [f"Namespace{index % 10}::Key{index}" for index in range(20000)]
+
+    def measure(func) -> float:
+        timings = []
+
+        for _ in range(5):
+            start = time.perf_counter()
+
+            for key in keys:
+                func(key)
+
+            timings.append(time.perf_counter() - start)
+
+        return min(timings)
+
+    assert measure(hash_string) < measure(primitive) * 2
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from ueloctool.api.enumerators.missing_string import MissingStringBehaviour
+from ueloctool.api.formats.locres.main import LocresFile
+from ueloctool.api.formats.locres.version import LocresVersion
+from ueloctool.helpers import import_file, parse_file
+from ueloctool.main import app
+
+
+@pytest.fixture
+def locres_file(tmp_path) -> Path:
+    locres = LocresFile.new(LocresVersion.OPTIMIZED)
+    locres.add_string("NS", "A", "Alpha")
+    locres.add_string("NS", "B", "Beta")
+    locres.add_string("NS", "C", "Gamma")
+    locres.save(tmp_path / "Game.locres")
+
+    return tmp_path / "Game.locres"
+
+
+def read_strings(locres_file: Path) -> dict[str, str]:
+    locres = parse_file(locres_file)
+    return {key: locres.get(key) for key in locres.keys()}
+
+
+def test_incremental_keeps_missing_strings(locres_file, tmp_path):
+    data_file = tmp_path / "Game.csv"
+    data_file.write_text(
+        "Key,SourceString,TranslatedString\nNS::A,Alpha,Alfa\nNS::B,Beta,\n"
+    )
+
+    changed = import_file(
+        locres_file, data_file, None, MissingStringBehaviour.KeyAndOriginal, True
+    )
+
+    # Untranslated NS::B is treated like NS::C, which isn't in the data at all
+    assert changed == 1
+    assert read_strings(locres_file) == {
+        "NS::A": "Alfa",
+        "NS::B": "Beta",
+        "NS::C": "Gamma",
+    }
+
+
+def test_incremental_rejects_missing_strings(locres_file, tmp_path):
+    data_file = tmp_path / "Game.json"
+    data_file.write_text('{"NS::A": "Alfa"}')
+
+    with pytest.raises(Exception, match="incremental"):
+        import_file(locres_file, data_file, None, MissingStringBehaviour.Error, True)
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "import",
+            "--original-file",
+            str(locres_file),
+            "--localization-data-file",
+            str(data_file),
+            "--missing-strings",
+            "error",
+            "--incremental",
+        ],
+    )
+
+    assert result.exit_code == 2
+    assert read_strings(locres_file)["NS::A"] == "Alpha"
@@ -0,0 +1,34 @@
+from io import BytesIO
+
+import pytest
+
+from ueloctool.api.interchange import InterchangeWriter, iter_interchange_entries
+
+ENTRIES = [
+    ("NS::Key", "Source", "Translated"),
+    ("Key", "", ""),
+    ("NS::Emoji", "😀 𝄞", "Zażółć gęślą jaźń"),
+]
+
+
+def write_entries() -> bytes:
+    file_handle = BytesIO()
+    writer = InterchangeWriter(file_handle)
+
+    for entry in ENTRIES:
+        writer.write(*entry)
+
+    writer.close()
+    return file_handle.getvalue()
+
+
+def test_round_trip():
+    assert list(iter_interchange_entries(BytesIO(write_entries()))) == ENTRIES
+
+
+def test_truncated_file():
+    data = write_entries()
+
+    for size in range(len(data)):
+        with pytest.raises(Exception, match="not a valid interchange file"):
+            list(iter_interchange_entries(BytesIO(data[:size])))
@@ -0,0 +1,39 @@
+import json
+from io import StringIO
+
+import pytest
+
+from ueloctool.api.jsonstream import iter_json_object
+
+DOCUMENTS = [
+    "{}",
+    " { } \n",
+    '{"a": 1}',
+    '{"a": "x", "b": [1, {"c": null}], "d": "\\u0105\\n"}\n',
+    '{\n    "NS::Key": "Zażółć gęślą jaźń",\n    "Key": "\\"quoted\\""\n}',
+]
+
+INVALID_DOCUMENTS = [
+    "",
+    "[]",
+    '{"a": 1',
+    '{"a": 1,}',
+    '{"a": 1}garbage',
+    '{"a": 1} {"b": 2}',
+    "{}x",
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64 * 1024])
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_matches_json_loads(document, chunk_size):
+    members = list(iter_json_object(StringIO(document), chunk_size))
+
+    assert dict(members) == json.loads(document)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64 * 1024])
+@pytest.mark.parametrize("document", INVALID_DOCUMENTS)
+def test_rejects_invalid_documents(document, chunk_size):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_object(StringIO(document), chunk_size))
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from ueloctool.api.enumerators.data_format import DataFormat
+from ueloctool.api.formats.locres.main import LocresFile
+from ueloctool.api.formats.locres.version import LocresVersion
+from ueloctool.helpers import parse_file
+
+FILES = 20
+KEYS = 50
+
+
+def get_expected(index: int) -> dict[str, str]:
+    return {
+        f"File{index}::Key{key_idx}": f"Value {index}.{key_idx}"
+        for key_idx in range(KEYS)
+    }
+
+
+@pytest.mark.parametrize("version", LocresVersion)
+def test_parse_many_files_in_sequence(tmp_path, version):
+    files = []
+
+    for index in range(FILES):
+        locres = LocresFile.new(version)
+
+        for key_idx in range(KEYS):
+            locres.add_string(
+                f"File{index}", f"Key{key_idx}", f"Value {index}.{key_idx}"
+            )
+
+        files.append(tmp_path / f"File{index}.locres")
+        locres.save(files[-1])
+
+    for index, input_file in enumerate(files):
+        handler = parse_file(input_file, use_cache=False)
+        output_file = input_file.with_suffix(".json")
+        handler.export(output_file, DataFormat.JSON)
+
+        with open(output_file, "r", encoding="utf-8") as file_handle:
+            assert json.load(file_handle) == get_expected(index)
+
+        assert handler.get_stats()["keys"] == KEYS
+
+        handler.reset()
+        assert handler.get_stats() == {"namespaces": 0, "keys": 0, "unique_strings": 0}
+        assert list(handler.keys()) == []
+
+        handler.close()
+
+
+def test_instances_do_not_share_state():
+    first = LocresFile.new(LocresVersion.OPTIMIZED)
+    second = LocresFile.new(LocresVersion.OPTIMIZED)
+    first.add_string("Namespace", "Key", "Value")
+
+    assert "Namespace::Key" in first
+    assert "Namespace::Key" not in second
+    assert list(second.keys()) == []
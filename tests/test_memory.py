@@ -0,0 +1,50 @@
+import tracemalloc
+
+import pytest
+
+from ueloctool.api.formats.locres.namespace import Namespace, NamespaceTable
+from ueloctool.api.formats.locres.string import String, StringEntry, StringTable
+from ueloctool.api.formats.locres.version import LocresVersion
+from ueloctool.benchmark import generate_locres
+from ueloctool.helpers import parse_file
+
+NAMESPACES = 10
+KEYS = 1000
+
+# Traced memory of a parsed model, names, keys and values included
+MAX_BYTES_PER_KEY = 256
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        String(key="Key", key_hash=0, value="Value", value_hash=0),
+        StringEntry("Value"),
+        StringTable(),
+        Namespace("Namespace"),
+        NamespaceTable(),
+    ],
+    ids=lambda instance: type(instance).__name__,
+)
+def test_model_has_no_instance_dict(instance):
+    assert not hasattr(instance, "__dict__")
+
+
+@pytest.mark.parametrize("version", LocresVersion)
+def test_parsed_model_memory(tmp_path, version):
+    locres_file = tmp_path / "Game.locres"
+    generate_locres(version, NAMESPACES, KEYS).save(locres_file)
+
+    tracemalloc.start()
+
+    try:
+        handler = parse_file(locres_file)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert handler.get_stats()["keys"] == NAMESPACES * KEYS
+    assert current < NAMESPACES * KEYS * MAX_BYTES_PER_KEY
+
+    # The file is read into a single buffer while parsing, on top of the model
+    assert peak < current + 2 * locres_file.stat().st_size
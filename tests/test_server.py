@@ -0,0 +1,195 @@
+import json
+import socket
+import threading
+from http.client import HTTPConnection
+
+import pytest
+
+from ueloctool.api.formats.locres.main import LocresFile
+from ueloctool.api.formats.locres.version import LocresVersion
+from ueloctool.server import LocalizationServer, ModelCache, remove_socket
+
+KEYS = 100
+
+
+def write_locres(locres_file, index: int):
+    locres = LocresFile.new(LocresVersion.OPTIMIZED)
+
+    for key_idx in range(KEYS):
+        locres.add_string(f"Namespace{index}", f"Key{index}.{key_idx}", "Value")
+
+    locres.save(locres_file)
+
+
+@pytest.fixture
+def server(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    write_locres(root / "Game.locres", 0)
+
+    server = LocalizationServer(("127.0.0.1", 0), ModelCache(), root)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def request(
+    server: LocalizationServer,
+    method: str,
+    path: str,
+    body: dict | None = None,
+    headers: dict | None = None,
+) -> tuple[int, dict]:
+    connection = HTTPConnection(*server.server_address)
+    headers = {"Content-Type": "application/json", **(headers or {})}
+    connection.request(method, path, json.dumps(body) if body else None, headers)
+    response = connection.getresponse()
+
+    try:
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_get(server):
+    status, response = request(
+        server, "GET", "/get?file=Game.locres&key=Namespace0::Key0.1"
+    )
+
+    assert status == 200
+    assert response == {"Namespace0::Key0.1": "Value"}
+
+
+def test_apply(server):
+    status, response = request(
+        server,
+        "POST",
+        "/apply",
+        {
+            "file": "Game.locres",
+            "data": {"Namespace0::Key0.1": "Translated"},
+            "missing_strings": "original",
+            "output_file": "Game.out.locres",
+        },
+    )
+
+    assert (status, response) == (200, {"changed": None})
+    assert (server.root / "Game.out.locres").exists()
+
+    _, response = request(
+        server,
+        "POST",
+        "/get",
+        {"file": "Game.out.locres", "keys": ["Namespace0::Key0.1"]},
+    )
+    assert response == {"Namespace0::Key0.1": "Translated"}
+
+
+def test_incremental_apply_rejects_missing_strings(server):
+    status, response = request(
+        server,
+        "POST",
+        "/apply",
+        {
+            "file": "Game.locres",
+            "data": {"Namespace0::Key0.1": "Translated"},
+            "missing_strings": "error",
+            "incremental": True,
+        },
+    )
+
+    assert status == 400
+    assert "incremental" in response["error"]
+
+
+def test_rejects_other_content_types(server):
+    # Browsers send text/plain cross-origin without a preflight request
+    status, _ = request(
+        server,
+        "POST",
+        "/apply",
+        {"file": "Game.locres", "data": {}, "output_file": "Game.out.locres"},
+        {"Content-Type": "text/plain"},
+    )
+
+    assert status == 415
+    assert not (server.root / "Game.out.locres").exists()
+
+
+@pytest.mark.parametrize("host", ["evil.example:8765", "127.0.0.1:1", ""])
+def test_rejects_other_hosts(server, host):
+    status, _ = request(
+        server,
+        "GET",
+        "/get?file=Game.locres&key=Namespace0::Key0.1",
+        headers={"Host": host},
+    )
+
+    assert status == 403
+
+
+def test_accepts_localhost(server):
+    host = f"localhost:{server.server_port}"
+    status, _ = request(server, "GET", "/get?file=Game.locres", headers={"Host": host})
+
+    assert status == 200
+
+
+def test_rejects_paths_outside_of_the_root(server, tmp_path):
+    victim = tmp_path / "victim.txt"
+    victim.write_text("data")
+    (server.root / "link.txt").symlink_to(victim)
+
+    for output_file in (str(victim), "../victim.txt", "link.txt"):
+        status, _ = request(
+            server,
+            "POST",
+            "/apply",
+            {"file": "Game.locres", "data": {}, "output_file": output_file},
+        )
+
+        assert status == 403
+        assert victim.read_text() == "data"
+
+    status, _ = request(server, "GET", f"/get?file={tmp_path / 'other.locres'}")
+    assert status == 403
+
+
+def test_remove_socket(tmp_path):
+    regular_file = tmp_path / "file.sock"
+    regular_file.write_text("data")
+
+    with pytest.raises(Exception, match="not a socket"):
+        remove_socket(regular_file)
+
+    assert regular_file.exists()
+
+    socket_file = tmp_path / "server.sock"
+
+    with socket.socket(socket.AF_UNIX) as unix_socket:
+        unix_socket.bind(str(socket_file))
+
+    remove_socket(socket_file)
+    remove_socket(socket_file)  # Already gone
+    assert not socket_file.exists()
+
+
+def test_intern_table_is_bounded_by_the_cache(tmp_path):
+    models = ModelCache(max_files=2)
+
+    for index in range(30):
+        write_locres(tmp_path / f"{index}.locres", index)
+        models.get(tmp_path / f"{index}.locres")
+
+    # Only names and keys of the cached files are kept alive
+    tables = {id(models.strings): models.strings}
+
+    for _, _, handler in models.entries.values():
+        tables[id(handler._strings)] = handler._strings
+
+    assert len(models.entries) == 2
+    assert sum(len(strings) for strings in tables.values()) <= 2 * (KEYS + 1)
@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from ueloctool.api.formats.locres.main import LocresFile
+from ueloctool.api.formats.locres.reader import LocresReader
+from ueloctool.api.formats.locres.shard import merge_locres, split_locres
+from ueloctool.api.formats.locres.version import LocresVersion
+from ueloctool.api.helpers import INT64, UINT32, ReadStringAt
+from ueloctool.api.magic import MAGIC_LOCRES
+from ueloctool.benchmark import generate_locres
+from ueloctool.main import app
+
+
+def read_references(locres_file: Path) -> dict[str, int]:
+    # String table of optimized versions, every string is followed by its count
+    data = memoryview(locres_file.read_bytes())
+    (offset,) = INT64.unpack_from(data, len(MAGIC_LOCRES) + 1)
+    (count,) = UINT32.unpack_from(data, offset)
+    offset += 4
+    references = {}
+
+    for _ in range(count):
+        text, offset = ReadStringAt(data, offset)
+        (references[text],) = UINT32.unpack_from(data, offset)
+        offset += 4
+
+    return references
+
+
+def write_locres(locres_file: Path, strings: dict[str, str]):
+    locres = LocresFile.new(LocresVersion.OPTIMIZED)
+
+    for key, value in strings.items():
+        namespace, name = key.split("::")
+        locres.add_string(namespace, name, value)
+
+    locres.save(locres_file)
+
+
+@pytest.mark.parametrize("max_keys", [None, 7])
+@pytest.mark.parametrize("version", LocresVersion, ids=lambda version: version.name)
+def test_split_merge_round_trip(tmp_path, version, max_keys):
+    generate_locres(version, namespaces=3, keys=20, utf16_ratio=0.5).save(
+        tmp_path / "Game.locres"
+    )
+
+    with (
+        open(tmp_path / "Game.locres", "rb") as file_handle,
+        LocresReader(file_handle) as reader,
+    ):
+        shards = list(split_locres(reader, tmp_path / "shards", "Game", max_keys))
+
+    assert len(shards) == (3 if max_keys is None else 9)
+
+    merged, duplicates = merge_locres(shards)
+    merged.save(tmp_path / "Merged.locres")
+
+    assert duplicates == 0
+    assert merged.version == version
+    assert (tmp_path / "Merged.locres").read_bytes() == (
+        tmp_path / "Game.locres"
+    ).read_bytes()
+
+
+def test_merge_duplicates(tmp_path):
+    write_locres(tmp_path / "A.locres", {"NS::A": "Shared", "NS::B": "One"})
+    write_locres(
+        tmp_path / "B.locres",
+        {"NS::A": "Other", "NS::C": "Shared", "UI::D": "One"},
+    )
+
+    merged, duplicates = merge_locres([tmp_path / "A.locres", tmp_path / "B.locres"])
+    merged.save(tmp_path / "Merged.locres")
+
+    # The first file wins, strings are counted over all inputs
+    assert duplicates == 1
+    assert merged.get("NS::A") == "Shared"
+    assert read_references(tmp_path / "Merged.locres") == {"Shared": 2, "One": 2}
+
+
+def test_merge_version_option(tmp_path):
+    write_locres(tmp_path / "A.locres", {"NS::A": "Value"})
+    runner = CliRunner()
+
+    def merge(version: str):
+        return runner.invoke(
+            app,
+            [
+                "merge",
+                "--input-file",
+                str(tmp_path / "A.locres"),
+                "--output-file",
+                str(tmp_path / "Merged.locres"),
+                "--version",
+                version,
+            ],
+        )
+
+    assert merge("OPTIMISED").exit_code == 2
+    assert not (tmp_path / "Merged.locres").exists()
+
+    assert merge("legacy").exit_code == 0
+
+    with (
+        open(tmp_path / "Merged.locres", "rb") as file_handle,
+        LocresReader(file_handle) as reader,
+    ):
+        assert reader.version == LocresVersion.LEGACY
+        assert reader["NS::A"] == "Value"
@@ -0,0 +1,103 @@
+import pytest
+
+from ueloctool.api.formats.locres.main import LocresFile
+from ueloctool.api.formats.locres.reader import LocresReader
+from ueloctool.api.formats.locres.version import LocresVersion
+from ueloctool.api.helpers import INT32, AppendString, ReadStringAt, SkipString
+from ueloctool.helpers import parse_file
+
+# Positive lengths are ASCII, negative ones UTF-16 code units
+LENGTHS = {"ascii": 100, "utf16": -100}
+
+STRINGS = ["", "ASCII", "Zażółć gęślą jaźń", "😀 emoji 𝄞", "日本語"]
+
+
+def test_string_round_trip():
+    buf = bytearray()
+
+    for string in STRINGS:
+        AppendString(buf, string)
+
+    data = memoryview(bytes(buf))
+    offset = 0
+
+    for string in STRINGS:
+        result, offset = ReadStringAt(data, offset)
+        assert result == string
+
+    assert offset == len(data)
+
+
+@pytest.mark.parametrize("version", LocresVersion, ids=lambda version: version.name)
+def test_locres_round_trip(tmp_path, version):
+    locres = LocresFile.new(version)
+
+    for index, string in enumerate(STRINGS):
+        locres.add_string(f"NS{string}", f"Key{index}{string}", string)
+
+    locres.save(tmp_path / "Game.locres")
+
+    with (
+        open(tmp_path / "Game.locres", "rb") as file_handle,
+        LocresReader(file_handle) as reader,
+    ):
+        assert {key: reader[key] for key in reader} == {
+            f"NS{string}::Key{index}{string}": string
+            for index, string in enumerate(STRINGS)
+        }
+
+
+def test_leading_byte_order_mark_is_kept(tmp_path):
+    # Decoded as utf-16-le, plain utf-16 would take U+FEFF for a byte order mark
+    buf = bytearray()
+    AppendString(buf, "\ufeffText")
+
+    assert ReadStringAt(memoryview(bytes(buf)), 0)[0] == "\ufeffText"
+
+    locres = LocresFile.new(LocresVersion.OPTIMIZED)
+    locres.add_string("NS", "Key", "\ufeffText")
+    locres.save(tmp_path / "Game.locres")
+
+    assert parse_file(tmp_path / "Game.locres").get("NS::Key") == "\ufeffText"
+
+
+@pytest.mark.parametrize("length", LENGTHS.values(), ids=LENGTHS.keys())
+def test_length_past_the_end(length):
+    data = memoryview(INT32.pack(length) + "Text".encode("utf-16-le"))
+
+    with pytest.raises(Exception, match="Invalid string length at offset 0"):
+        ReadStringAt(data, 0)
+
+    with pytest.raises(Exception, match="Invalid string length at offset 0"):
+        SkipString(data, 0)
+
+    # Up to the end is fine
+    for valid_length in (8, -4):
+        data = memoryview(INT32.pack(valid_length) + "Text".encode("utf-16-le"))
+        assert SkipString(data, 0) == len(data)
+        assert ReadStringAt(data, 0)[1] == len(data)
+
+
+@pytest.mark.parametrize("length", LENGTHS.values(), ids=LENGTHS.keys())
+@pytest.mark.parametrize("string", ["Key", "Value"])
+@pytest.mark.parametrize("version", LocresVersion, ids=lambda version: version.name)
+def test_corrupt_locres_lengths(tmp_path, version, string, length):
+    locres = LocresFile.new(version)
+    locres.add_string("NS", "Key", "Value")
+    locres.save(tmp_path / "Game.locres")
+
+    data = (tmp_path / "Game.locres").read_bytes()
+    prefix = INT32.pack(len(string) + 1) + string.encode("ascii") + b"\0"
+    assert data.count(prefix) == 1
+
+    corrupt_prefix = INT32.pack(length) + prefix[4:]
+    (tmp_path / "Game.locres").write_bytes(data.replace(prefix, corrupt_prefix))
+
+    with pytest.raises(Exception, match="Invalid string length"):
+        parse_file(tmp_path / "Game.locres")
+
+    with (
+        pytest.raises(Exception, match="Invalid string length"),
+        open(tmp_path / "Game.locres", "rb") as file_handle,
+    ):
+        LocresReader(file_handle)
@@ -0,0 +1,26 @@
+import csv
+from pathlib import Path
+from typing import Iterable, Iterator
+
+FIELDNAMES = ["Key", "SourceString", "TranslatedString"]
+
+
+def export_csv(data: Iterable[tuple[str, str]], output_file: Path, **options):
+    with open(output_file, "w", encoding="utf-8", newline="") as file_handle:
+        writer = csv.DictWriter(file_handle, fieldnames=FIELDNAMES)
+        writer.writeheader()
+
+        for key, value in data:
+            writer.writerow(
+                {
+                    "Key": key,
+                    "SourceString": value,
+                    "TranslatedString": "",
+                }
+            )
+
+
+def read_csv(input_file: Path) -> Iterator[tuple[str, str, str]]:
+    with open(input_file, "r", encoding="utf-8", newline="") as file_handle:
+        for row in csv.DictReader(file_handle):
+            yield row["Key"], row["SourceString"], row["TranslatedString"]
@@ -5,3 +5,4 @@ class DataFormat(str, Enum):
     JSON = "json"
     CSV = "csv"
     PO = "po"
+    BINARY = "bin"
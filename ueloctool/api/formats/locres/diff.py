@@ -0,0 +1,70 @@
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from ueloctool.api.formats.locres.reader import LocresReader
+
+
+@dataclass
+class Changeset:
+    """
+    Keys that differ between two builds of a locres file.
+
+    Attributes:
+        added: Keys only present in the new build.
+        removed: Keys only present in the old build.
+        changed: Keys whose source string changed, according to its hash.
+    """
+
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+
+    def save(self, output_file: Path):
+        with open(output_file, "w", encoding="utf-8") as file_handle:
+            json.dump(asdict(self), file_handle, indent=4, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, input_file: Path) -> "Changeset":
+        with open(input_file, "r", encoding="utf-8") as file_handle:
+            return cls(**json.load(file_handle))
+
+
+def diff_locres(old: LocresReader, new: LocresReader) -> Changeset:
+    """
+    Compare two builds by the source string hash stored for every key.
+
+    Only the key tables are read, string values are never decoded.
+    """
+
+    changeset = Changeset()
+
+    for key in new:
+        old_hash = old.get_hash(key)
+
+        if old_hash is None:
+            changeset.added.append(key)
+        elif old_hash != new.get_hash(key):
+            changeset.changed.append(key)
+
+    changeset.removed = [key for key in old if key not in new]
+    return changeset
+
+
+def iter_prefill(
+    changeset: Changeset, translations: LocresReader
+) -> Iterator[tuple[str, str]]:
+    """
+    Get the old translations that are still valid in the new build.
+
+    Strings whose source changed or that were removed are skipped, the rest are
+    decoded from the old translated file as they are needed.
+    """
+
+    stale = set(changeset.changed)
+    stale.update(changeset.removed)
+
+    for key in translations:
+        if key not in stale:
+            yield key, translations[key]
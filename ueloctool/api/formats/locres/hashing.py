@@ -0,0 +1,55 @@
+from functools import lru_cache
+from struct import pack, unpack
+from typing import Callable
+from zlib import crc32
+
+from ueloctool.api.formats.locres.version import LocresVersion
+
+
+def StrCrc32(string: str) -> int:
+    """FCrc::StrCrc32 - CRC32 over every UTF-16 code unit widened to 32 bits."""
+
+    if string.isascii() or max(string) <= "\uffff":
+        return crc32(string.encode("utf-32-le"))
+
+    # Characters outside of the BMP are hashed as surrogate pairs (UTF-16 TCHAR)
+    data = string.encode("utf-16-le")
+    units = unpack(f"<{len(data) // 2}H", data)
+    return crc32(pack(f"<{len(units)}I", *units))
+
+
+def CityHash64(data: bytes) -> int:
+    # Only the newest version needs cityhash, the first call replaces this stub
+    # with the real function so it isn't imported on every startup
+    global CityHash64
+    from cityhash import CityHash64
+
+    return CityHash64(data)
+
+
+def CityHash64UTF16(string: str) -> int:
+    """TextKeyUtil::HashString - CityHash64 of the UTF-16 string folded to 32 bits."""
+
+    value = CityHash64(string.encode("utf-16-le"))
+    return ((value & 0xFFFFFFFF) + (value >> 32) * 23) & 0xFFFFFFFF
+
+
+def NoHash(string: str) -> int:
+    return 0
+
+
+def get_hash_function(version: LocresVersion) -> Callable[[str], int]:
+    """Get the function the engine uses to hash namespaces and keys for a version."""
+
+    if version.value >= LocresVersion.OPTIMIZED_CITYHASH64_UTF16.value:
+        return CityHash64UTF16
+    elif version.value >= LocresVersion.OPTIMIZED.value:
+        return StrCrc32
+    else:
+        return NoHash
+
+
+@lru_cache(maxsize=4096)
+def HashNamespace(name: str, version: LocresVersion) -> int:
+    # Namespace names repeat a lot across files, keep recent ones memoized
+    return get_hash_function(version)(name)
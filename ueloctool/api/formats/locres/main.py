@@ -1,181 +1,262 @@
-from binascii import crc32
 from io import BufferedReader
 from pathlib import Path
-
-from cityhash import CityHash64
+from struct import Struct
+from typing import Iterable, Iterator
 
 from ueloctool.api.enumerators.data_format import DataFormat
 from ueloctool.api.enumerators.missing_string import MissingStringBehaviour
-from ueloctool.api.formats.locres.namespace import Namespace
-from ueloctool.api.formats.locres.string import String, StringEntry
+from ueloctool.api.formats.locres.hashing import (
+    HashNamespace,
+    StrCrc32,
+    get_hash_function,
+)
+from ueloctool.api.formats.locres.namespace import NamespaceTable, get_full_key
+from ueloctool.api.formats.locres.string import String, StringTable
 from ueloctool.api.formats.locres.version import LocresVersion
 from ueloctool.api.handler import Handler
-from ueloctool.api.helpers import ReadString, WriteString
+from ueloctool.api.helpers import INT64, UINT32, AppendString, ReadStringAt
 from ueloctool.api.magic import MAGIC_LOCRES
 
+KEY_ENTRY = Struct("<II")  # Source string hash, LUT index
+
 
 class LocresFile(Handler):
 
     __file_version: LocresVersion
-    __namespaces: list[Namespace] = []
-
-    def __init__(self, file: BufferedReader, allow_legacy: bool = False):
-        super().__init__(file)
+    __header: bytes
+    __namespaces: NamespaceTable
+
+    def __init__(
+        self,
+        file: BufferedReader,
+        allow_legacy: bool = False,
+        header: bytes = b"",
+        strings: dict[str, str] | None = None,
+    ):
+        super().__init__(file, header, strings)
+        self.__namespaces = NamespaceTable()
 
-        self._file_handle.seek(0)
-        file_magic = self._file_handle.read(0x10)
+        # Magic and version, only what the detection didn't read yet
+        header += self._file_handle.read(max(0x11 - len(header), 0))
+        self.__header = header
 
-        if file_magic == MAGIC_LOCRES:
+        if header[:0x10] == MAGIC_LOCRES:
             try:
-                version_int = int.from_bytes(self._file_handle.read(1))
+                version_int = int.from_bytes(header[0x10:0x11])
                 self.__file_version = LocresVersion(version_int)
             except ValueError:
                 raise Exception(
-                    "This version of the locres file format is not supported. (Locres version: {version_int})"
+                    f"This version of the locres file format is not supported. (Locres version: {version_int})"
                 )
         else:
             if not allow_legacy:
                 raise Exception("This is not a valid locres file.")
 
             self.__file_version = LocresVersion.LEGACY
-            self._file_handle.seek(0)
+
+    @classmethod
+    def new(cls, version: LocresVersion) -> "LocresFile":
+        """Create an empty locres file of the given version, to be filled with `add_string`."""
+
+        handler = cls.__new__(cls)
+        handler._file_handle = None
+        handler._strings = None
+        handler.__header = b""
+        handler.__file_version = version
+        handler.__namespaces = NamespaceTable()
+        return handler
+
+    @property
+    def version(self) -> LocresVersion:
+        return self.__file_version
+
+    def add_string(
+        self,
+        namespace_name: str,
+        key: str,
+        value: str,
+        key_hash: int | None = None,
+        value_hash: int | None = None,
+        namespace_hash: int | None = None,
+    ):
+        # Missing hashes are calculated on save
+        self.__namespaces.add_string(
+            self.__namespaces.get_or_add(namespace_name, hash=namespace_hash),
+            String(key=key, key_hash=key_hash, value=value, value_hash=value_hash),
+        )
+
+    def __contains__(self, key: str) -> bool:
+        return self.__namespaces.find(key) is not None
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        string = self.__namespaces.find(key)
+        return default if string is None else string.value
+
+    def keys(self, namespace: str | None = None) -> Iterator[str]:
+        for current in self.__namespaces:
+            if namespace is None or current.name == namespace:
+                for string in current.strings:
+                    yield get_full_key(current.name, string.key)
+
+    def reset(self):
+        self.__namespaces = NamespaceTable()
+
+    def get_stats(self) -> dict[str, int]:
+        values = set()
+        keys = 0
+
+        for namespace in self.__namespaces:
+            keys += len(namespace.strings)
+            values.update(string.value for string in namespace.strings)
+
+        return {
+            "namespaces": len(self.__namespaces),
+            "keys": keys,
+            "unique_strings": len(values),
+        }
 
     def parse(self):
+        self.reset()
+
+        # Read the whole file once and decode it with offset arithmetic,
+        # instead of issuing a read call for every field. The stream is never
+        # rewound, the header read by the constructor is put back in front
+        data = memoryview(self.__header + self._file_handle.read())
+        self.__header = b""
+
+        # Names and keys repeat across namespaces and files, values are
+        # deduplicated by the LUT already
+        interned = self._strings if self._strings is not None else {}
+
         if self.__file_version.value >= LocresVersion.COMPACT.value:
-            strings = self.__parse_compact()
+            strings, offset = self.__parse_compact(data)
         else:
-            self.__parse_legacy()
+            self.__parse_legacy(data, interned)
             return
 
-        if self.__file_version.value >= LocresVersion.OPTIMIZED.value:
-            self._file_handle.seek(4, 1)  # Skip the Keys Count
+        is_optimized = self.__file_version.value >= LocresVersion.OPTIMIZED.value
 
-        namespace_count = int.from_bytes(self._file_handle.read(4), byteorder="little")
+        if is_optimized:
+            offset += 4  # Skip the Keys Count
+
+        (namespace_count,) = UINT32.unpack_from(data, offset)
+        offset += 4
 
         for _ in range(namespace_count):
             namespace_hash = None
 
-            if self.__file_version.value >= LocresVersion.OPTIMIZED.value:
-                namespace_hash = int.from_bytes(
-                    self._file_handle.read(4), byteorder="little"
-                )
+            if is_optimized:
+                (namespace_hash,) = UINT32.unpack_from(data, offset)
+                offset += 4
+
+            namespace_name, offset = ReadStringAt(data, offset, interned)
+            (key_count,) = UINT32.unpack_from(data, offset)
+            offset += 4
 
-            namespace_name = ReadString(self._file_handle)
-            key_count = int.from_bytes(self._file_handle.read(4), byteorder="little")
+            if key_count == 0:
+                continue
+
+            namespace = self.__namespaces.get_or_add(
+                namespace_name, hash=namespace_hash
+            )
 
             for _ in range(key_count):
                 key_hash = None
 
-                if self.__file_version.value >= LocresVersion.OPTIMIZED.value:
-                    key_hash = int.from_bytes(
-                        self._file_handle.read(4), byteorder="little"
-                    )
+                if is_optimized:
+                    (key_hash,) = UINT32.unpack_from(data, offset)
+                    offset += 4
+
+                key, offset = ReadStringAt(data, offset, interned)
+                source_string_hash, string_idx = KEY_ENTRY.unpack_from(data, offset)
+                offset += KEY_ENTRY.size
 
-                key = ReadString(self._file_handle)
-                source_string_hash = int.from_bytes(
-                    self._file_handle.read(4), byteorder="little"
+                self.__namespaces.add_string(
+                    namespace,
+                    String(
+                        key=key,
+                        key_hash=key_hash,
+                        value=strings[string_idx],
+                        value_hash=source_string_hash,
+                    ),
                 )
 
-                if self.__file_version.value >= LocresVersion.COMPACT.value:
-                    string_idx = int.from_bytes(
-                        self._file_handle.read(4), byteorder="little"
-                    )
-
-                    namespace = next(
-                        (ns for ns in self.__namespaces if ns.name == namespace_name),
-                        None,
-                    )
-
-                    if not namespace:
-                        namespace = Namespace(namespace_name, hash=namespace_hash)
-                        self.__namespaces.append(namespace)
-
-                    namespace.strings.append(
-                        String(
-                            key=key,
-                            key_hash=key_hash,
-                            value=strings[string_idx],
-                            value_hash=source_string_hash,
-                        )
-                    )
-
-    def __parse_compact(self):
+    def __parse_compact(self, data: memoryview) -> tuple[list[str], int]:
         strings = []
-        strings_offset = int.from_bytes(self._file_handle.read(8), byteorder="little")
-        header_offset = self._file_handle.tell()
+        header_offset = len(MAGIC_LOCRES) + 1
+        (strings_offset,) = INT64.unpack_from(data, header_offset)
+        header_offset += 8
 
-        if strings_offset < 0:
+        if strings_offset < 0 or strings_offset >= len(data):
             raise Exception("Invalid localized strings offset.")
 
-        self._file_handle.seek(strings_offset)
-        strings_count = int.from_bytes(self._file_handle.read(4), byteorder="little")
+        (strings_count,) = UINT32.unpack_from(data, strings_offset)
+        offset = strings_offset + 4
 
-        for _ in range(strings_count):
-            strings.append(ReadString(self._file_handle))
-
-            if self.__file_version.value >= LocresVersion.OPTIMIZED.value:
-                self._file_handle.read(4)
+        if self.__file_version.value >= LocresVersion.OPTIMIZED.value:
+            for _ in range(strings_count):
+                string, offset = ReadStringAt(data, offset)
+                strings.append(string)
+                offset += 4  # Skip the reference count
+        else:
+            for _ in range(strings_count):
+                string, offset = ReadStringAt(data, offset)
+                strings.append(string)
 
-        self._file_handle.seek(header_offset)
-        return strings
+        return strings, header_offset
 
-    def __parse_legacy(self):
-        hash_table_count = int.from_bytes(self._file_handle.read(4), byteorder="little")
+    def __parse_legacy(self, data: memoryview, interned: dict[str, str]):
+        (hash_table_count,) = UINT32.unpack_from(data, 0)
+        offset = 4
 
         for _ in range(hash_table_count):
-            namespace_name = ReadString(self._file_handle)
-            strings_count = int.from_bytes(
-                self._file_handle.read(4), byteorder="little"
-            )
+            namespace_name, offset = ReadStringAt(data, offset, interned)
+            (strings_count,) = UINT32.unpack_from(data, offset)
+            offset += 4
 
-            for _ in range(strings_count):
-                key_hash = ReadString(self._file_handle)
-                source_string_hash = int.from_bytes(
-                    self._file_handle.read(4), byteorder="little"
-                )
+            if strings_count == 0:
+                continue
 
-                namespace = next(
-                    (ns for ns in self.__namespaces if ns.name == namespace_name),
-                    None,
-                )
+            namespace = self.__namespaces.get_or_add(namespace_name)
 
-                if not namespace:
-                    namespace = Namespace(namespace_name)
-                    self.__namespaces.append(namespace)
+            for _ in range(strings_count):
+                key, offset = ReadStringAt(data, offset, interned)
+                (source_string_hash,) = UINT32.unpack_from(data, offset)
+                value, offset = ReadStringAt(data, offset + 4)
 
-                namespace.strings.append(
+                self.__namespaces.add_string(
+                    namespace,
                     String(
-                        key=key_hash,
+                        key=key,
                         key_hash=0,
-                        value=ReadString(self._file_handle),
+                        value=value,
                         value_hash=source_string_hash,
-                    )
+                    ),
                 )
 
-    def export(self, output_file: Path, mode: DataFormat):
-        data = []
+    def export(
+        self,
+        output_file: Path,
+        mode: DataFormat,
+        po_wrap_width: int | None = None,
+    ):
+        super().export(self.__iter_strings(), output_file, mode, po_wrap_width)
 
+    def __iter_strings(self) -> Iterator[tuple[str, str]]:
         for namespace in self.__namespaces:
             for string in namespace.strings:
-                key = (
-                    f"{namespace.name}::{string.key}" if namespace.name else string.key
-                )
-                data.append((key, string.value))
-
-        super().export(data, output_file, mode)
+                yield get_full_key(namespace.name, string.key), string.value
 
     def apply_language_data(
         self, data: dict[str, str], missing_strings_behaviour: MissingStringBehaviour
     ):
         # Find all strings that need to be updated
 
-        new_namespaces: list[Namespace] = []
+        new_namespaces = NamespaceTable()
 
         for namespace in self.__namespaces:
             for string in namespace.strings:
-                key = (
-                    f"{namespace.name}::{string.key}" if namespace.name else string.key
-                )
+                key = get_full_key(namespace.name, string.key)
 
                 if key not in data:
                     match missing_strings_behaviour:
@@ -194,129 +275,107 @@ class LocresFile(Handler):
                 else:
                     value = data[key]
 
-                new_namespace = next(
-                    (ns for ns in new_namespaces if ns.name == namespace.name),
-                    None,
+                new_namespace = new_namespaces.get_or_add(
+                    namespace.name, hash=namespace.hash
                 )
 
-                if not new_namespace:
-                    new_namespace = Namespace(namespace.name)
-                    new_namespaces.append(new_namespace)
-
-                new_namespace.strings.append(
+                new_namespaces.add_string(
+                    new_namespace,
                     String(
                         key=string.key,
                         key_hash=string.key_hash,
                         value=value,
                         value_hash=string.value_hash,
-                    )
+                    ),
                 )
 
         self.__namespaces = new_namespaces
 
-    def __calc_hash(self, namespace_name: str) -> int:
-        if self.__file_version.value == LocresVersion.OPTIMIZED_CITYHASH64_UTF16.value:
-            return CityHash64(namespace_name)
-        elif self.__file_version.value >= LocresVersion.OPTIMIZED.value:
-            return crc32(namespace_name)
-        else:
-            return 0
+    def patch_language_data(self, data: Iterable[tuple[str, str]]) -> int:
+        # Update only the strings whose value differs, keeping the rest of the model
+        changed = 0
+
+        for key, value in data:
+            string = self.__namespaces.find(key)
+
+            if string is None or string.value == value:
+                continue
+
+            string.value = value
+            changed += 1
+
+        return changed
 
     def save(self, output_file: Path):
+        # Serialize into memory first so the file is written with a single call
+        buffer = bytearray()
+
+        if self.__file_version.value != LocresVersion.LEGACY.value:
+            self.__save_compact(buffer)
+        else:
+            self.__save_legacy(buffer)
+
         with open(output_file, "wb") as new_file:
-            if self.__file_version.value != LocresVersion.LEGACY.value:
-                self.__save_compact(new_file)
-            else:
-                self.__save_legacy(new_file)
+            new_file.write(buffer)
 
-    def __save_compact(self, file):
-        file.write(MAGIC_LOCRES)
-        file.write(self.__file_version.value.to_bytes(1))
+    def __save_compact(self, buffer: bytearray):
+        buffer += MAGIC_LOCRES
+        buffer += self.__file_version.value.to_bytes(1)
 
-        header_offset = file.tell()
-        file.write(int(0).to_bytes(8))  # Placeholder for header offset
+        header_offset = len(buffer)
+        buffer += bytes(8)  # Placeholder for header offset
 
         if self.__file_version.value >= LocresVersion.OPTIMIZED.value:
             keys_count = sum(len(namespace.strings) for namespace in self.__namespaces)
-            file.write(keys_count.to_bytes(4, byteorder="little"))
+            buffer += UINT32.pack(keys_count)
 
-        namespaces_count = len(self.__namespaces)
-        file.write(namespaces_count.to_bytes(4, byteorder="little"))
+        buffer += UINT32.pack(len(self.__namespaces))
 
-        entries: list[StringEntry] = []
+        entries = StringTable()
+        hash_string = get_hash_function(self.__file_version)
 
         for namespace in self.__namespaces:
             if self.__file_version.value >= LocresVersion.OPTIMIZED.value:
-                if namespace.hash == 0:
-                    file.write(
-                        self.__calc_hash(namespace.name).to_bytes(
-                            4, byteorder="little"
-                        ),
-                    )
-                else:
-                    file.write(namespace.hash.to_bytes(4, byteorder="little"))
+                buffer += UINT32.pack(
+                    namespace.hash or HashNamespace(namespace.name, self.__file_version)
+                )
 
-            WriteString(file, namespace.name)
-            file.write(len(namespace.strings).to_bytes(4, byteorder="little"))
+            AppendString(buffer, namespace.name)
+            buffer += UINT32.pack(len(namespace.strings))
 
             for string in namespace.strings:
                 if self.__file_version.value >= LocresVersion.OPTIMIZED.value:
-                    if string.key_hash:
-                        file.write(string.key_hash.to_bytes(4, byteorder="little"))
-                    else:
-                        file.write(
-                            self.__calc_hash(string.key).to_bytes(4, byteorder="little")
-                        )
+                    buffer += UINT32.pack(string.key_hash or hash_string(string.key))
 
-                WriteString(file, string.key)
-
-                if string.value_hash:
-                    file.write(string.value_hash.to_bytes(4, byteorder="little"))
-                else:
-                    file.write(crc32(string.value).to_bytes(4, byteorder="little"))
+                AppendString(buffer, string.key)
 
                 # Save only unique strings
-                string_idx = next(
-                    (idx for idx, s in enumerate(entries) if s.text == string.value),
-                    None,
+                buffer += KEY_ENTRY.pack(
+                    string.value_hash or StrCrc32(string.value),
+                    entries.add(string.value),
                 )
 
-                if string_idx is None:
-                    entry = StringEntry(string.value)
-                    entries.append(entry)
-                    string_idx = entries.index(entry)
-                else:
-                    entries[string_idx].references += 1
-
-                file.write(string_idx.to_bytes(4, byteorder="little"))
-
-        strings_offset = file.tell()
-        file.write(len(entries).to_bytes(4, byteorder="little"))
+        strings_offset = len(buffer)
+        buffer += UINT32.pack(len(entries))
 
         if self.__file_version.value >= LocresVersion.OPTIMIZED.value:
             for entry in entries:
-                WriteString(file, entry.text)
-                file.write(entry.references.to_bytes(4, byteorder="little"))
+                AppendString(buffer, entry.text)
+                buffer += UINT32.pack(entry.references)
         else:
             for entry in entries:
-                WriteString(file, entry.text)
+                AppendString(buffer, entry.text)
 
-        file.seek(header_offset)
-        file.write(strings_offset.to_bytes(8, byteorder="little"))
+        INT64.pack_into(buffer, header_offset, strings_offset)
 
-    def __save_legacy(self, file):
-        file.write(len(self.__namespaces).to_bytes(4, byteorder="little"))
+    def __save_legacy(self, buffer: bytearray):
+        buffer += UINT32.pack(len(self.__namespaces))
 
         for namespace in self.__namespaces:
-            WriteString(file, namespace.name)
-            file.write(len(namespace.strings).to_bytes(4, byteorder="little"))
+            AppendString(buffer, namespace.name)
+            buffer += UINT32.pack(len(namespace.strings))
 
             for string in namespace.strings:
-                WriteString(file, string.key)
-
-                if string.value_hash:
-                    file.write(string.value_hash.to_bytes(4, byteorder="little"))
-                else:
-                    file.write(crc32(string.value).to_bytes(4, byteorder="little"))
-
-                WriteString(file, string.value)
+                AppendString(buffer, string.key)
+                buffer += UINT32.pack(string.value_hash or StrCrc32(string.value))
+                AppendString(buffer, string.value)
@@ -1,10 +1,65 @@
 from dataclasses import dataclass, field
+from typing import Iterator
 
 from ueloctool.api.formats.locres.string import String
 
 
-@dataclass
+def get_full_key(namespace_name: str, key: str) -> str:
+    return f"{namespace_name}::{key}" if namespace_name else key
+
+
+@dataclass(slots=True)
 class Namespace:
     name: str
     hash: int | None = None
     strings: list[String] = field(default_factory=lambda: [])
+
+
+@dataclass(slots=True)
+class NamespaceTable:
+    """
+    Ordered collection of namespaces with hash indexes for lookups.
+
+    Attributes:
+        namespaces: Namespaces in on-disk order.
+        by_name: Index of namespaces by their name.
+        by_key: Index of strings by their full key (Namespace::Key), built on first lookup.
+    """
+
+    namespaces: list[Namespace] = field(default_factory=lambda: [])
+    by_name: dict[str, Namespace] = field(default_factory=lambda: {})
+    by_key: dict[str, String] | None = None
+
+    def __iter__(self) -> Iterator[Namespace]:
+        return iter(self.namespaces)
+
+    def __len__(self) -> int:
+        return len(self.namespaces)
+
+    def get_or_add(self, name: str, hash: int | None = None) -> Namespace:
+        namespace = self.by_name.get(name)
+
+        if namespace is None:
+            namespace = Namespace(name, hash=hash)
+            self.namespaces.append(namespace)
+            self.by_name[name] = namespace
+
+        return namespace
+
+    def add_string(self, namespace: Namespace, string: String):
+        namespace.strings.append(string)
+
+        if self.by_key is not None:
+            self.by_key.setdefault(get_full_key(namespace.name, string.key), string)
+
+    def find(self, key: str) -> String | None:
+        if self.by_key is None:
+            self.by_key = {}
+
+            for namespace in self.namespaces:
+                for string in namespace.strings:
+                    self.by_key.setdefault(
+                        get_full_key(namespace.name, string.key), string
+                    )
+
+        return self.by_key.get(key)
@@ -0,0 +1,235 @@
+import mmap
+from io import BufferedReader, UnsupportedOperation
+from typing import Iterator
+
+from ueloctool.api.formats.locres.main import KEY_ENTRY
+from ueloctool.api.formats.locres.namespace import get_full_key
+from ueloctool.api.formats.locres.version import LocresVersion
+from ueloctool.api.helpers import INT64, UINT32, ReadStringAt, SkipString
+from ueloctool.api.magic import MAGIC_LOCRES
+
+
+class LocresReader:
+    """
+    Read-only view of a locres file that decodes string values on demand.
+
+    Only the namespace/key table is decoded when the reader is created, values are
+    decoded from their offset in the file when accessed, e.g. `reader["NS::Key"]`.
+    """
+
+    __file_version: LocresVersion
+    __index: dict[str, int]
+    __hashes: dict[str, int]
+    __key_hashes: dict[str, int]
+    __namespace_hashes: dict[str, int]
+    __namespaces: dict[str, list[str]]
+
+    def __init__(self, file: BufferedReader, strings: dict[str, str] | None = None):
+        self.__mmap = None
+        self.__strings = strings if strings is not None else {}
+
+        try:
+            self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__data = memoryview(self.__mmap)
+        except (AttributeError, OSError, UnsupportedOperation, ValueError):
+            # Not backed by a regular file (or empty), fall back to reading it
+            file.seek(0)
+            self.__data = memoryview(file.read())
+
+        self.__index = {}
+        self.__hashes = {}
+        self.__key_hashes = {}
+        self.__namespace_hashes = {}
+        self.__namespaces = {}
+
+        if self.__data[: len(MAGIC_LOCRES)] == MAGIC_LOCRES:
+            version_int = self.__data[len(MAGIC_LOCRES)]
+
+            try:
+                self.__file_version = LocresVersion(version_int)
+            except ValueError:
+                raise Exception(
+                    f"This version of the locres file format is not supported. (Locres version: {version_int})"
+                )
+
+            self.__index_compact()
+        else:
+            self.__file_version = LocresVersion.LEGACY
+            self.__index_legacy()
+
+    @property
+    def version(self) -> LocresVersion:
+        return self.__file_version
+
+    @property
+    def namespaces(self) -> list[str]:
+        return list(self.__namespaces)
+
+    def keys(self, namespace: str | None = None) -> Iterator[str]:
+        if namespace is None:
+            return iter(self.__index)
+
+        return (
+            get_full_key(namespace, key) for key in self.__namespaces.get(namespace, [])
+        )
+
+    def strings(self, namespace: str) -> Iterator[tuple[str, str, int, int | None]]:
+        """
+        Decode the strings of a namespace.
+
+        Yields `(key, value, source string hash, key hash)`, the key hash is only
+        stored by optimized versions and None otherwise.
+        """
+
+        for key in self.__namespaces.get(namespace, []):
+            full_key = get_full_key(namespace, key)
+            yield (
+                key,
+                self[full_key],
+                self.__hashes[full_key],
+                self.__key_hashes.get(full_key),
+            )
+
+    def get_namespace_hash(self, namespace: str) -> int | None:
+        return self.__namespace_hashes.get(namespace)
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        offset = self.__index.get(key)
+
+        if offset is None:
+            return default
+
+        return ReadStringAt(self.__data, offset)[0]
+
+    def get_hash(self, key: str) -> int | None:
+        """Get the source string hash of a key, without decoding its value."""
+
+        return self.__hashes.get(key)
+
+    def __getitem__(self, key: str) -> str:
+        value = self.get(key)
+
+        if value is None:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__index)
+
+    def __len__(self) -> int:
+        return len(self.__index)
+
+    def close(self):
+        self.__data.release()
+
+        if self.__mmap is not None:
+            self.__mmap.close()
+            self.__mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __add_key(
+        self,
+        namespace_name: str,
+        key: str,
+        source_hash: int,
+        value_offset: int,
+        key_hash: int | None = None,
+    ):
+        full_key = get_full_key(namespace_name, key)
+
+        self.__namespaces.setdefault(namespace_name, []).append(key)
+        self.__index.setdefault(full_key, value_offset)
+        self.__hashes.setdefault(full_key, source_hash)
+
+        if key_hash is not None:
+            self.__key_hashes.setdefault(full_key, key_hash)
+
+    def __index_compact(self):
+        data = self.__data
+        is_optimized = self.__file_version.value >= LocresVersion.OPTIMIZED.value
+
+        offset = len(MAGIC_LOCRES) + 1
+        (strings_offset,) = INT64.unpack_from(data, offset)
+        offset += 8
+
+        if strings_offset < 0 or strings_offset >= len(data):
+            raise Exception("Invalid localized strings offset.")
+
+        # Only record where each LUT entry starts, without decoding it
+        (strings_count,) = UINT32.unpack_from(data, strings_offset)
+        string_offsets = []
+        string_offset = strings_offset + 4
+
+        for _ in range(strings_count):
+            string_offsets.append(string_offset)
+            string_offset = SkipString(data, string_offset)
+
+            if is_optimized:
+                string_offset += 4  # Skip the reference count
+
+        if is_optimized:
+            offset += 4  # Skip the Keys Count
+
+        (namespace_count,) = UINT32.unpack_from(data, offset)
+        offset += 4
+
+        for _ in range(namespace_count):
+            namespace_hash = None
+
+            if is_optimized:
+                (namespace_hash,) = UINT32.unpack_from(data, offset)
+                offset += 4
+
+            namespace_name, offset = ReadStringAt(data, offset, self.__strings)
+            (key_count,) = UINT32.unpack_from(data, offset)
+            offset += 4
+
+            if namespace_hash is not None:
+                self.__namespace_hashes.setdefault(namespace_name, namespace_hash)
+
+            for _ in range(key_count):
+                key_hash = None
+
+                if is_optimized:
+                    (key_hash,) = UINT32.unpack_from(data, offset)
+                    offset += 4
+
+                key, offset = ReadStringAt(data, offset, self.__strings)
+                source_hash, string_idx = KEY_ENTRY.unpack_from(data, offset)
+                offset += KEY_ENTRY.size
+
+                self.__add_key(
+                    namespace_name,
+                    key,
+                    source_hash,
+                    string_offsets[string_idx],
+                    key_hash,
+                )
+
+    def __index_legacy(self):
+        data = self.__data
+
+        (hash_table_count,) = UINT32.unpack_from(data, 0)
+        offset = 4
+
+        for _ in range(hash_table_count):
+            namespace_name, offset = ReadStringAt(data, offset, self.__strings)
+            (strings_count,) = UINT32.unpack_from(data, offset)
+            offset += 4
+
+            for _ in range(strings_count):
+                key, offset = ReadStringAt(data, offset, self.__strings)
+                (source_hash,) = UINT32.unpack_from(data, offset)
+                offset += 4
+
+                self.__add_key(namespace_name, key, source_hash, offset)
+                offset = SkipString(data, offset)
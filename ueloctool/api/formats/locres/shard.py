@@ -0,0 +1,135 @@
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from ueloctool.api.enumerators.data_format import DataFormat
+from ueloctool.api.formats.locres.main import LocresFile
+from ueloctool.api.formats.locres.namespace import get_full_key
+from ueloctool.api.formats.locres.reader import LocresReader
+from ueloctool.api.formats.locres.version import LocresVersion
+from ueloctool.api.registry import get_exporter
+
+# Namespace, key, value, source string hash and key hash
+Entry = tuple[str, str, str, int, int | None]
+
+
+def iter_shards(
+    reader: LocresReader, max_keys: int | None = None
+) -> Iterator[list[Entry]]:
+    """
+    Group the strings of a locres file into shards.
+
+    Every namespace gets its own shard, unless `max_keys` is given, then shards
+    are filled up to that many strings and namespaces may span several of them.
+    Values are only decoded for the shard being built.
+    """
+
+    shard: list[Entry] = []
+
+    for namespace in reader.namespaces:
+        for key, value, source_hash, key_hash in reader.strings(namespace):
+            shard.append((namespace, key, value, source_hash, key_hash))
+
+            if max_keys and len(shard) >= max_keys:
+                yield shard
+                shard = []
+
+        if not max_keys and shard:
+            yield shard
+            shard = []
+
+    if shard:
+        yield shard
+
+
+def split_locres(
+    reader: LocresReader,
+    output_dir: Path,
+    stem: str,
+    max_keys: int | None = None,
+    data_format: DataFormat | None = None,
+) -> Iterator[Path]:
+    """
+    Write the shards of a locres file, yielding their paths as they are written.
+
+    Shards are valid locres files of the same version, or language data files
+    in `data_format` when given.
+    """
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    for index, shard in enumerate(iter_shards(reader, max_keys)):
+        if data_format is None:
+            output_file = output_dir / f"{stem}.{index:04d}.locres"
+            locres = LocresFile.new(reader.version)
+
+            for namespace, key, value, source_hash, key_hash in shard:
+                locres.add_string(
+                    namespace,
+                    key,
+                    value,
+                    key_hash=key_hash,
+                    value_hash=source_hash,
+                    namespace_hash=reader.get_namespace_hash(namespace),
+                )
+
+            locres.save(output_file)
+        else:
+            output_file = output_dir / f"{stem}.{index:04d}.{data_format.value}"
+            get_exporter(data_format)(
+                (
+                    (get_full_key(namespace, key), value)
+                    for namespace, key, value, _, _ in shard
+                ),
+                output_file,
+            )
+
+        yield output_file
+
+
+def merge_locres(
+    input_files: Iterable[Path], version: LocresVersion | None = None
+) -> tuple[LocresFile, int]:
+    """
+    Combine locres files into one, returning it with the number of duplicate keys.
+
+    Inputs are read one at a time and their strings decoded as they are added,
+    the first file that has a key wins. Saving the result builds a single string
+    table shared by all inputs, with reference counts over all of them. The
+    version defaults to the one of the first file.
+    """
+
+    merged: LocresFile | None = None
+    duplicates = 0
+
+    for input_file in input_files:
+        with open(input_file, "rb") as file_handle, LocresReader(file_handle) as reader:
+            if merged is None:
+                merged = LocresFile.new(version or reader.version)
+
+            # Stored hashes are kept, unless the version hashes differently
+            keep_hashes = reader.version == merged.version
+
+            for namespace in reader.namespaces:
+                namespace_hash = None
+
+                if keep_hashes:
+                    namespace_hash = reader.get_namespace_hash(namespace)
+
+                for key, value, source_hash, key_hash in reader.strings(namespace):
+                    if get_full_key(namespace, key) in merged:
+                        duplicates += 1
+                        continue
+
+                    merged.add_string(
+                        namespace,
+                        key,
+                        value,
+                        key_hash=key_hash if keep_hashes else None,
+                        value_hash=source_hash,
+                        namespace_hash=namespace_hash,
+                    )
+
+    if merged is None:
+        raise Exception("No files to merge.")
+
+    return merged, duplicates
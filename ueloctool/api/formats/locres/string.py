@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Iterator
 
 
-@dataclass
+@dataclass(slots=True)
 class String:
     key: str
     key_hash: int
@@ -9,7 +10,39 @@ class String:
     value_hash: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StringEntry:
     text: str
     references: int = 1
+
+
+@dataclass(slots=True)
+class StringTable:
+    """
+    Builder for the localized strings LUT, storing each unique text once.
+
+    Attributes:
+        entries: Unique strings in the order they were first added.
+        indexes: Index of entries by their text.
+    """
+
+    entries: list[StringEntry] = field(default_factory=lambda: [])
+    indexes: dict[str, int] = field(default_factory=lambda: {})
+
+    def __iter__(self) -> Iterator[StringEntry]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, text: str) -> int:
+        string_idx = self.indexes.get(text)
+
+        if string_idx is None:
+            string_idx = len(self.entries)
+            self.entries.append(StringEntry(text))
+            self.indexes[text] = string_idx
+        else:
+            self.entries[string_idx].references += 1
+
+        return string_idx
@@ -1,73 +1,69 @@
-import csv
-import json
 from abc import ABC, abstractmethod
 from io import BufferedReader
 from pathlib import Path
-
-from polib import POEntry, POFile
+from typing import Iterable
 
 from ueloctool.api.enumerators.data_format import DataFormat
 from ueloctool.api.enumerators.missing_string import MissingStringBehaviour
+from ueloctool.api.registry import get_exporter
 
 
 class Handler(ABC):
 
     _file_handle: BufferedReader
+    _strings: dict[str, str] | None
 
     @abstractmethod
-    def __init__(self, file: BufferedReader):
+    def __init__(
+        self,
+        file: BufferedReader,
+        header: bytes = b"",
+        strings: dict[str, str] | None = None,
+    ):
+        # `header` holds bytes already read from the start of the file by format
+        # detection, handlers continue from there instead of seeking back.
+        # `strings` is an intern table for names and keys, shared across files
         self._file_handle = file
+        self._strings = strings
 
     @abstractmethod
     def parse(self):
         raise NotImplementedError("This method must be implemented by the subclass.")
 
-    def export(self, data: tuple[str, str], output_file: Path, mode: DataFormat):
-        match mode:
-            case DataFormat.JSON:
-                self.__export_json(data, output_file)
-            case DataFormat.CSV:
-                self.__export_csv(data, output_file)
-            case DataFormat.PO:
-                self.__export_po(data, output_file)
-            case _:
-                raise Exception("Unsupported export mode.")
-
-    def __export_json(self, data: tuple[str, str], output_file: Path):
-        result_dict = {}
-
-        for key, value in data:
-            if key in result_dict:
-                raise Exception(f"Duplicate key found: {key}")
-
-            result_dict[key] = value
-
-        with open(output_file, "w", encoding="utf-8") as file_handle:
-            json.dump(result_dict, file_handle, indent=4, ensure_ascii=False)
-
-    def __export_csv(self, data: tuple[str, str], output_file: Path):
-        with open(output_file, "w", encoding="utf-8", newline="") as file_handle:
-            writer = csv.DictWriter(
-                file_handle, fieldnames=["Key", "SourceString", "TranslatedString"]
-            )
-            writer.writeheader()
-
-            for key, value in data:
-                writer.writerow(
-                    {
-                        "Key": key,
-                        "SourceString": value,
-                        "TranslatedString": "",
-                    }
-                )
-
-    def __export_po(self, data: tuple[str, str], output_file: Path):
-        po = POFile()
-
-        for key, value in data:
-            po.append(POEntry(msgctxt=key, msgid=value))
-
-        po.save(output_file)
+    @abstractmethod
+    def reset(self):
+        raise NotImplementedError("This method must be implemented by the subclass.")
+
+    def get_stats(self) -> dict[str, int]:
+        return {}
+
+    def close(self):
+        # The file handle is owned by the caller, only drop our reference to it
+        self.reset()
+        self._file_handle = None
+
+    def __getstate__(self):
+        # File handles can't be pickled, parsed handlers don't need them anymore.
+        # Neither the intern table, it belongs to the session that parsed the file
+        state = self.__dict__.copy()
+        state["_file_handle"] = None
+        state["_strings"] = None
+        return state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def export(
+        self,
+        data: Iterable[tuple[str, str]],
+        output_file: Path,
+        mode: DataFormat,
+        po_wrap_width: int | None = None,
+    ):
+        get_exporter(mode)(data, output_file, po_wrap_width=po_wrap_width)
 
     @abstractmethod
     def apply_language_data(
@@ -75,6 +71,10 @@ class Handler(ABC):
     ):
         raise NotImplementedError("This method must be implemented by the subclass.")
 
+    @abstractmethod
+    def patch_language_data(self, data: Iterable[tuple[str, str]]) -> int:
+        raise NotImplementedError("This method must be implemented by the subclass.")
+
     @abstractmethod
     def save(self, output_file: Path):
         raise NotImplementedError("This method must be implemented by the subclass.")
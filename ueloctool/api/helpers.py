@@ -1,28 +1,65 @@
-from io import BufferedReader
+from struct import Struct
 
+INT32 = Struct("<i")
+UINT32 = Struct("<I")
+INT64 = Struct("<q")
 
-def ReadString(buf: BufferedReader) -> str:
-    length = int.from_bytes(buf.read(4), byteorder="little", signed=True)
+
+def ReadStringAt(
+    data: memoryview, offset: int, strings: dict[str, str] | None = None
+) -> tuple[str, int]:
+    """
+    Read a string from `data` at `offset`, returning it with the offset past it.
+
+    The string is decoded straight from a slice of the buffer. When an intern
+    table is given, an equal string already in it is returned instead, so keys
+    and namespaces repeated across files share a single object.
+    """
+
+    (length,) = INT32.unpack_from(data, offset)
+    offset += 4
 
     if length > 0:
-        result = buf.read(length).decode("ascii")
+        end = offset + length
+        encoding = "ascii"
     elif length < 0:
-        result = buf.read(length * -2).decode("utf-16")
+        end = offset + length * -2
+        encoding = "utf-16-le"
     else:
-        result = ""
+        return "", offset
+
+    # A corrupt length must fail here, not silently decode the rest of the file
+    if end > len(data):
+        raise Exception(f"Invalid string length at offset {offset - 4}.")
+
+    result = str(data[offset:end], encoding).rstrip("\0")
+
+    if strings is not None:
+        result = strings.setdefault(result, result)
 
-    return result.rstrip("\0")
+    return result, end
 
 
-def WriteString(buf: BufferedReader, string: str) -> None:
+def AppendString(buf: bytearray, string: str) -> None:
     if string:
         string += "\0"
 
-    is_ascii = all(ord(char) < 128 for char in string)
-
-    if is_ascii:
-        buf.write(len(string).to_bytes(4, byteorder="little", signed=True))
-        buf.write(string.encode("ascii"))
+    if string.isascii():
+        buf += INT32.pack(len(string))
+        buf += string.encode("ascii")
     else:
-        buf.write((-len(string)).to_bytes(4, byteorder="little", signed=True))
-        buf.write(string.encode("utf-16-le"))
+        # Characters outside of the BMP take two UTF-16 code units
+        encoded = string.encode("utf-16-le")
+        buf += INT32.pack(-(len(encoded) // 2))
+        buf += encoded
+
+
+def SkipString(data: memoryview, offset: int) -> int:
+    (length,) = INT32.unpack_from(data, offset)
+    offset += 4
+    end = offset + (length if length >= 0 else length * -2)
+
+    if end > len(data):
+        raise Exception(f"Invalid string length at offset {offset - 4}.")
+
+    return end
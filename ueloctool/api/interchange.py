@@ -0,0 +1,105 @@
+from pathlib import Path
+from struct import Struct
+from typing import BinaryIO, Iterable, Iterator
+
+from ueloctool.api.helpers import UINT32
+
+MAGIC_INTERCHANGE = b"UELT"
+INTERCHANGE_VERSION = 1
+
+HEADER = Struct("<4sBI")  # Magic, version, entries count
+ENTRY_HEADER = Struct("<III")  # Key, source string and translated string lengths
+
+
+class InterchangeWriter:
+    """
+    Writer for the binary interchange format.
+
+    The file is a header followed by entries, each entry is the byte lengths of its
+    key, source string and translated string followed by the UTF-8 encoded strings.
+    """
+
+    def __init__(self, file_handle: BinaryIO):
+        self.__file_handle = file_handle
+        self.__count = 0
+
+        # Entries count is filled in on close, entries are streamed in
+        self.__header_offset = file_handle.tell()
+        file_handle.write(HEADER.pack(MAGIC_INTERCHANGE, INTERCHANGE_VERSION, 0))
+
+    def write(self, key: str, source_string: str, translated_string: str = ""):
+        key_bytes = key.encode("utf-8")
+        source_bytes = source_string.encode("utf-8")
+        translated_bytes = translated_string.encode("utf-8")
+
+        self.__file_handle.write(
+            ENTRY_HEADER.pack(len(key_bytes), len(source_bytes), len(translated_bytes))
+            + key_bytes
+            + source_bytes
+            + translated_bytes
+        )
+        self.__count += 1
+
+    def close(self):
+        end_offset = self.__file_handle.tell()
+        self.__file_handle.seek(self.__header_offset + HEADER.size - UINT32.size)
+        self.__file_handle.write(UINT32.pack(self.__count))
+        self.__file_handle.seek(end_offset)
+
+
+def iter_interchange_entries(file_handle: BinaryIO) -> Iterator[tuple[str, str, str]]:
+    """Read the binary interchange format, yielding `(key, source, translated)`."""
+
+    header = file_handle.read(HEADER.size)
+
+    if len(header) < HEADER.size:
+        raise Exception("This is not a valid interchange file.")
+
+    magic, version, count = HEADER.unpack(header)
+
+    if magic != MAGIC_INTERCHANGE:
+        raise Exception("This is not a valid interchange file.")
+
+    if version != INTERCHANGE_VERSION:
+        raise Exception(
+            f"This version of the interchange format is not supported. (Version: {version})"
+        )
+
+    read = file_handle.read
+
+    for _ in range(count):
+        entry_header = read(ENTRY_HEADER.size)
+
+        if len(entry_header) < ENTRY_HEADER.size:
+            raise Exception("This is not a valid interchange file.")
+
+        key_length, source_length, translated_length = ENTRY_HEADER.unpack(entry_header)
+        size = key_length + source_length + translated_length
+        data = read(size)
+
+        # A truncated file would otherwise decode as a shorter last entry
+        if len(data) < size:
+            raise Exception("This is not a valid interchange file.")
+
+        source_offset = key_length + source_length
+
+        yield (
+            data[:key_length].decode("utf-8"),
+            data[key_length:source_offset].decode("utf-8"),
+            data[source_offset:].decode("utf-8"),
+        )
+
+
+def export_binary(data: Iterable[tuple[str, str]], output_file: Path, **options):
+    with open(output_file, "wb") as file_handle:
+        writer = InterchangeWriter(file_handle)
+
+        for key, value in data:
+            writer.write(key, value)
+
+        writer.close()
+
+
+def read_binary(input_file: Path) -> Iterator[tuple[str, str, str]]:
+    with open(input_file, "rb") as file_handle:
+        yield from iter_interchange_entries(file_handle)
@@ -0,0 +1,105 @@
+import json
+import re
+from json.decoder import scanstring
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+
+CHUNK_SIZE = 64 * 1024
+
+OBJECT_START = re.compile(r"[ \t\n\r]*\{[ \t\n\r]*")
+KEY_START = re.compile(r'[ \t\n\r]*"')
+KEY_SEPARATOR = re.compile(r"[ \t\n\r]*:[ \t\n\r]*")
+MEMBER_END = re.compile(r"[ \t\n\r]*([,}])")
+OBJECT_END = re.compile(r"[ \t\n\r]*\}")
+
+
+def iter_json_object(
+    file_handle: TextIO, chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[str, Any]]:
+    """
+    Incrementally parse a top-level JSON object.
+
+    Members are yielded as `(key, value)` pairs while the file is read in chunks,
+    so the whole document never has to be loaded at once.
+    """
+
+    scan_once = json.JSONDecoder().scan_once
+    buffer = file_handle.read(chunk_size)
+
+    while not (match := OBJECT_START.match(buffer)):
+        chunk = file_handle.read(chunk_size)
+
+        if not chunk or buffer.strip():
+            raise json.JSONDecodeError("Expecting '{'", buffer, 0)
+
+        buffer += chunk
+
+    pos = match.end()
+    is_first = True
+
+    while True:
+        start = pos
+
+        if is_first and (match := OBJECT_END.match(buffer, pos)):
+            _check_end(file_handle, buffer, match.end(), chunk_size)
+            return
+
+        # A member is only accepted once its closing ',' or '}' is in the buffer,
+        # otherwise more data is read and the whole member is parsed again
+        try:
+            key, pos = scanstring(buffer, KEY_START.match(buffer, pos).end())
+            value, pos = scan_once(buffer, KEY_SEPARATOR.match(buffer, pos).end())
+            match = MEMBER_END.match(buffer, pos)
+            pos = match.end()
+        except (AttributeError, StopIteration, ValueError):
+            chunk = file_handle.read(chunk_size)
+
+            if not chunk:
+                raise json.JSONDecodeError("Invalid object member", buffer, start)
+
+            buffer = buffer[start:] + chunk
+            pos = 0
+            continue
+
+        is_first = False
+        yield key, value
+
+        if match[1] == "}":
+            _check_end(file_handle, buffer, pos, chunk_size)
+            return
+
+
+def _check_end(file_handle: TextIO, buffer: str, pos: int, chunk_size: int):
+    # Like json.load, only whitespace may follow the object
+    while buffer:
+        if buffer[pos:].strip(" \t\n\r"):
+            raise json.JSONDecodeError("Extra data", buffer, pos)
+
+        buffer = file_handle.read(chunk_size)
+        pos = 0
+
+
+def export_json(data: Iterable[tuple[str, str]], output_file: Path, **options):
+    # Write entries as they come instead of building the whole dict first,
+    # the output matches json.dump(..., indent=4)
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    keys = set()
+
+    with open(output_file, "w", encoding="utf-8") as file_handle:
+        file_handle.write("{")
+
+        for key, value in data:
+            if key in keys:
+                raise Exception(f"Duplicate key found: {key}")
+
+            file_handle.write(",\n    " if keys else "\n    ")
+            file_handle.write(f"{encode(key)}: {encode(value)}")
+            keys.add(key)
+
+        file_handle.write("\n}" if keys else "}")
+
+
+def read_json(input_file: Path) -> Iterator[tuple[str, None, Any]]:
+    with open(input_file, "r", encoding="utf-8") as file_handle:
+        for key, value in iter_json_object(file_handle):
+            yield key, None, value
@@ -0,0 +1,171 @@
+import re
+import textwrap
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+PO_ESCAPES = {
+    "\\": "\\",
+    '"': '"',
+    "n": "\n",
+    "t": "\t",
+    "r": "\r",
+    "a": "\a",
+    "b": "\b",
+    "f": "\f",
+    "v": "\v",
+}
+
+ESCAPE_PATTERN = re.compile(r"\\(.)")
+ESCAPED_CHARACTERS = ("\\", "\n", "\r", "\t", "\v", "\b", "\f", '"')
+
+DEFAULT_WRAP_WIDTH = 78
+
+
+def unescape(string: str) -> str:
+    if "\\" not in string:
+        return string
+
+    return ESCAPE_PATTERN.sub(lambda match: PO_ESCAPES.get(match[1], match[1]), string)
+
+
+def iter_po_entries(file_handle: TextIO) -> Iterator[tuple[str | None, str, str]]:
+    """
+    Read a PO catalogue entry by entry.
+
+    Yields `(msgctxt, msgid, msgstr)` for every entry. The header, comments and
+    obsolete entries are skipped, plural entries only give their singular form.
+    """
+
+    fields: dict[str, str] = {}
+    current: str | None = None
+
+    def get_entry():
+        if fields.get("msgid") or fields.get("msgctxt") is not None:
+            return fields.get("msgctxt"), fields["msgid"], fields.get("msgstr", "")
+
+    for line in file_handle:
+        line = line.strip()
+
+        if not line or line.startswith("#"):
+            continue
+
+        if line.startswith('"'):
+            if current:
+                fields[current] += unescape(line[1:-1])
+
+            continue
+
+        keyword, _, value = line.partition(" ")
+
+        if keyword in ("msgctxt", "msgid") and "msgid" in fields:
+            if entry := get_entry():
+                yield entry
+
+            fields = {}
+
+        if keyword == "msgstr[0]":
+            keyword = "msgstr"
+        elif keyword not in ("msgctxt", "msgid", "msgstr"):
+            # msgid_plural and other plural forms
+            current = None
+            continue
+
+        current = keyword
+        fields[keyword] = unescape(value.strip()[1:-1])
+
+    if "msgid" in fields and (entry := get_entry()):
+        yield entry
+
+
+def escape(string: str) -> str:
+    return (
+        string.replace("\\", r"\\")
+        .replace("\t", r"\t")
+        .replace("\r", r"\r")
+        .replace("\n", r"\n")
+        .replace("\v", r"\v")
+        .replace("\b", r"\b")
+        .replace("\f", r"\f")
+        .replace('"', r"\"")
+    )
+
+
+def format_field(name: str, value: str, wrap_width: int = DEFAULT_WRAP_WIDTH) -> str:
+    """Format a PO field, wrapping it the same way polib and gettext tools do."""
+
+    lines = value.splitlines(True)
+
+    if len(lines) > 1:
+        lines = [""] + lines
+    else:
+        # Field name, one space and two quotes
+        max_length = wrap_width - (len(name) + 3)
+
+        # Escaped characters don't count towards the limit, only count them if needed
+        if wrap_width > 0 and len(value) > max_length:
+            max_length += sum(value.count(char) for char in ESCAPED_CHARACTERS)
+
+        if wrap_width > 0 and len(value) > max_length:
+            lines = [""] + [
+                unescape(line)
+                for line in textwrap.wrap(
+                    escape(value),
+                    wrap_width - 2,
+                    drop_whitespace=False,
+                    break_long_words=False,
+                )
+            ]
+        else:
+            return f'{name} "{escape(value)}"\n'
+
+    result = [f'{name} "{escape(lines[0])}"\n']
+    result.extend(f'"{escape(line)}"\n' for line in lines[1:])
+    return "".join(result)
+
+
+class POWriter:
+    """
+    Streaming PO catalogue writer.
+
+    Entries are written to the file as they are added, without building the whole
+    catalogue in memory. A `wrap_width` of 0 disables line wrapping.
+    """
+
+    def __init__(self, file_handle: TextIO, wrap_width: int = DEFAULT_WRAP_WIDTH):
+        self.__file_handle = file_handle
+        self.__wrap_width = wrap_width
+
+        # Empty header entry, as written by polib
+        self.__file_handle.write('#\nmsgid ""\nmsgstr ""\n')
+
+    def write(self, msgctxt: str | None, msgid: str, msgstr: str = ""):
+        entry = ["\n"]
+
+        if msgctxt is not None:
+            entry.append(format_field("msgctxt", msgctxt, self.__wrap_width))
+
+        entry.append(format_field("msgid", msgid, self.__wrap_width))
+        entry.append(format_field("msgstr", msgstr, self.__wrap_width))
+
+        self.__file_handle.write("".join(entry))
+
+
+def export_po(
+    data: Iterable[tuple[str, str]],
+    output_file: Path,
+    po_wrap_width: int | None = None,
+    **options,
+):
+    if po_wrap_width is None:
+        po_wrap_width = DEFAULT_WRAP_WIDTH
+
+    with open(output_file, "w", encoding="utf-8") as file_handle:
+        writer = POWriter(file_handle, po_wrap_width)
+
+        for key, value in data:
+            writer.write(key, value)
+
+
+def read_po(input_file: Path) -> Iterator[tuple[str | None, str, str]]:
+    with open(input_file, "r", encoding="utf-8") as file_handle:
+        yield from iter_po_entries(file_handle)
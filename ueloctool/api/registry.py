@@ -0,0 +1,72 @@
+from importlib import import_module
+from typing import Any, Callable
+
+from ueloctool.api.enumerators.data_format import DataFormat
+from ueloctool.api.magic import MAGIC_LOCRES
+
+# Implementations are referenced as "module:attribute" and imported on first use,
+# so a command only pays for the formats it actually touches
+
+# File formats that can be parsed
+HANDLERS: dict[str, str] = {
+    "locres": "ueloctool.api.formats.locres.main:LocresFile",
+}
+HANDLER_SUFFIXES: dict[str, str] = {
+    ".locres": "locres",
+}
+
+# Leading bytes identifying a file format, checked before the file extension
+SIGNATURES: dict[bytes, str] = {
+    MAGIC_LOCRES: "locres",
+}
+HEADER_SIZE = max(len(signature) for signature in SIGNATURES)
+
+# Called as `exporter(data, output_file, **options)` with `(key, value)` pairs
+EXPORTERS: dict[DataFormat, str] = {
+    DataFormat.JSON: "ueloctool.api.jsonstream:export_json",
+    DataFormat.CSV: "ueloctool.api.csvdata:export_csv",
+    DataFormat.PO: "ueloctool.api.po:export_po",
+    DataFormat.BINARY: "ueloctool.api.interchange:export_binary",
+}
+
+# Called as `reader(input_file)`, yield `(key, source string, translated string)`,
+# the source string is None for formats that only store translations
+READERS: dict[DataFormat, str] = {
+    DataFormat.JSON: "ueloctool.api.jsonstream:read_json",
+    DataFormat.CSV: "ueloctool.api.csvdata:read_csv",
+    DataFormat.PO: "ueloctool.api.po:read_po",
+    DataFormat.BINARY: "ueloctool.api.interchange:read_binary",
+}
+
+
+def load(reference: str) -> Any:
+    module_name, attribute = reference.split(":")
+    return getattr(import_module(module_name), attribute)
+
+
+def detect_format(header: bytes) -> str | None:
+    """Get the name of the handler whose signature the header starts with."""
+
+    for signature, name in SIGNATURES.items():
+        if header.startswith(signature):
+            return name
+
+    return None
+
+
+def get_handler_class(name: str) -> type:
+    return load(HANDLERS[name])
+
+
+def get_exporter(data_format: DataFormat) -> Callable:
+    if data_format not in EXPORTERS:
+        raise Exception("Unsupported export mode.")
+
+    return load(EXPORTERS[data_format])
+
+
+def get_reader(data_format: DataFormat) -> Callable:
+    if data_format not in READERS:
+        raise Exception("Unsupported language data format.")
+
+    return load(READERS[data_format])
@@ -0,0 +1,110 @@
+import copy
+import glob
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import takewhile
+from pathlib import Path
+from typing import Callable, Iterator
+
+from ueloctool.api.enumerators.missing_string import MissingStringBehaviour
+from ueloctool.api.handler import Handler
+from ueloctool.helpers import parse_language_data
+
+GLOB_CHARACTERS = ("*", "?", "[")
+
+
+@dataclass
+class BatchResult:
+    file: Path
+    elapsed: float
+    error: str | None = None
+
+
+def find_files(pattern: str, suffix: str) -> tuple[Path, list[Path]]:
+    """
+    Find files to process in a batch job.
+
+    Returns the base directory (used to mirror the directory structure in the output)
+    and the sorted list of matched files.
+    """
+
+    path = Path(pattern)
+
+    if path.is_dir():
+        return path, sorted(file for file in path.rglob(f"*{suffix}") if file.is_file())
+
+    base = Path(
+        *takewhile(
+            lambda part: not any(char in part for char in GLOB_CHARACTERS),
+            path.parent.parts,
+        )
+    )
+
+    files = sorted(
+        Path(file)
+        for file in glob.glob(pattern, recursive=True)
+        if Path(file).is_file()
+    )
+
+    return base, files
+
+
+def _run_job(func: Callable, file: Path, *args) -> BatchResult:
+    start = time.perf_counter()
+
+    try:
+        func(file, *args)
+    except Exception as e:
+        return BatchResult(
+            file, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+        )
+
+    return BatchResult(file, time.perf_counter() - start)
+
+
+def run_batch(
+    func: Callable,
+    jobs: list[tuple],
+    workers: int | None = None,
+    initializer: Callable | None = None,
+    initargs: tuple = (),
+) -> Iterator[BatchResult]:
+    """
+    Run `func(*job)` for every job on a process pool, yielding results as they finish.
+
+    The first element of each job is the file being processed.
+    """
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as executor:
+        futures = [executor.submit(_run_job, func, *job) for job in jobs]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
+# Parsed base file, sent once to every worker process instead of once per job
+_shared_handler: Handler | None = None
+
+
+def init_shared_handler(handler: Handler):
+    global _shared_handler
+    _shared_handler = handler
+
+
+def apply_shared_language_data(
+    localization_data_file: Path,
+    output_file: Path,
+    missing_strings: MissingStringBehaviour,
+):
+    # Applying language data replaces the model instead of modifying it,
+    # so a shallow copy keeps the shared base intact for the next job
+    handler = copy.copy(_shared_handler)
+    handler.apply_language_data(
+        parse_language_data(localization_data_file, missing_strings), missing_strings
+    )
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    handler.save(output_file)
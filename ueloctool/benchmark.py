@@ -0,0 +1,183 @@
+import json
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable
+
+from ueloctool.api.enumerators.data_format import DataFormat
+from ueloctool.api.enumerators.missing_string import MissingStringBehaviour
+from ueloctool.api.formats.locres.main import LocresFile
+from ueloctool.api.formats.locres.version import LocresVersion
+from ueloctool.helpers import parse_language_data
+
+
+def generate_locres(
+    version: LocresVersion,
+    namespaces: int = 10,
+    keys: int = 1000,
+    duplicate_ratio: float = 0.2,
+    utf16_ratio: float = 0.1,
+    seed: int = 0,
+) -> LocresFile:
+    """
+    Generate a synthetic locres file.
+
+    Args:
+        version: Locres format version of the file.
+        namespaces: Number of namespaces.
+        keys: Number of keys in every namespace.
+        duplicate_ratio: Chance of a string reusing an already generated value.
+        utf16_ratio: Chance of a new string containing non-ASCII characters.
+        seed: Seed for the random generator, the same seed gives the same file.
+    """
+
+    rng = random.Random(seed)
+    locres = LocresFile.new(version)
+    values: list[str] = []
+
+    for namespace_idx in range(namespaces):
+        for key_idx in range(keys):
+            if values and rng.random() < duplicate_ratio:
+                value = rng.choice(values)
+            else:
+                value = f"Synthetic string {len(values)}"
+
+                if rng.random() < utf16_ratio:
+                    value += " - zażółć gęślą jaźń"
+
+                values.append(value)
+
+            locres.add_string(f"Namespace{namespace_idx}", f"Key{key_idx}", value)
+
+    return locres
+
+
+def measure(func: Callable[[], None], repeat: int) -> float:
+    # Best of N runs, the least disturbed by the rest of the system
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def measure_import_time(module: str = "ueloctool.main", repeat: int = 3) -> float:
+    """Time importing a module in a fresh interpreter, as reported by -X importtime."""
+
+    timings = []
+
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # import time: self [us] | cumulative | imported package
+        for line in process.stderr.splitlines():
+            columns = line.split("|")
+
+            if len(columns) == 3 and columns[2].strip() == module:
+                timings.append(int(columns[1]) / 1_000_000)
+                break
+        else:
+            raise Exception(f"Import time of {module} not reported.")
+
+    return min(timings)
+
+
+def run_benchmark(
+    version: LocresVersion,
+    namespaces: int,
+    keys: int,
+    duplicate_ratio: float,
+    utf16_ratio: float,
+    repeat: int = 3,
+) -> dict[str, float]:
+    """Time every handler operation on a synthetic file, in seconds per operation."""
+
+    results = {}
+    locres = generate_locres(version, namespaces, keys, duplicate_ratio, utf16_ratio)
+
+    with TemporaryDirectory() as temp_dir:
+        locres_file = Path(temp_dir) / "Game.locres"
+        results["save"] = measure(lambda: locres.save(locres_file), repeat)
+
+        def parse():
+            with open(locres_file, "rb") as file_handle:
+                handler = LocresFile(file_handle, allow_legacy=True)
+                handler.parse()
+
+            return handler
+
+        results["parse"] = measure(parse, repeat)
+        handler = parse()
+
+        for data_format in DataFormat:
+            data_file = Path(temp_dir) / f"Game.{data_format.value}"
+
+            results[f"export_{data_format.value}"] = measure(
+                lambda: handler.export(data_file, data_format), repeat
+            )
+
+            def apply():
+                lang_data = parse_language_data(
+                    data_file, MissingStringBehaviour.Original
+                )
+                handler.apply_language_data(lang_data, MissingStringBehaviour.Original)
+                handler.save(locres_file.with_suffix(".out.locres"))
+
+            results[f"import_{data_format.value}"] = measure(apply, repeat)
+
+    return results
+
+
+def run_benchmarks(
+    versions: list[LocresVersion], parameters: dict, repeat: int = 3
+) -> dict[str, dict[str, float]]:
+    """Run the benchmark of every version and of the CLI startup, grouped by name."""
+
+    results = {
+        version.name: run_benchmark(version, **parameters, repeat=repeat)
+        for version in versions
+    }
+
+    # Guards the CLI startup, paid by every single invocation
+    results["startup"] = {"import": measure_import_time(repeat=repeat)}
+    return results
+
+
+def load_baseline(baseline_file: Path, parameters: dict) -> dict[str, dict[str, float]]:
+    with open(baseline_file, "r", encoding="utf-8") as file_handle:
+        baseline_data = json.load(file_handle)
+
+    if baseline_data["parameters"] != parameters:
+        raise Exception("Baseline was recorded with different parameters.")
+
+    return baseline_data["results"]
+
+
+def write_baseline(
+    baseline_file: Path, parameters: dict, results: dict[str, dict[str, float]]
+):
+    with open(baseline_file, "w", encoding="utf-8") as file_handle:
+        json.dump({"parameters": parameters, "results": results}, file_handle, indent=4)
+
+
+def find_regressions(
+    results: dict[str, float], baseline: dict[str, float], tolerance: float
+) -> list[str]:
+    """Get the names of operations that got slower than the baseline allows."""
+
+    return [
+        name
+        for name, elapsed in results.items()
+        if name in baseline and elapsed > baseline[name] * (1 + tolerance)
+    ]
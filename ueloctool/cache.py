@@ -0,0 +1,116 @@
+import gc
+import hashlib
+import os
+import pickle
+import warnings
+from contextlib import suppress
+from io import BufferedReader
+from pathlib import Path
+
+from ueloctool.api.handler import Handler
+
+# Bump whenever the pickled model changes shape, so stale snapshots are ignored
+CACHE_VERSION = 2
+DEFAULT_CACHE_SIZE = 1024 * 1024 * 1024
+
+
+def get_cache_dir() -> Path:
+    if cache_dir := os.environ.get("UELOCTOOL_CACHE_DIR"):
+        return Path(cache_dir)
+
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "ueloctool"
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed handlers, keyed by file size, mtime and content hash.
+
+    Snapshots are evicted in least recently used order once the cache grows
+    past `max_size` bytes. The cache is best-effort, failing to read or write it
+    only prints a warning. Snapshots are pickles and loading one can run
+    arbitrary code, so the cache directory must not be writable by others.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, max_size: int | None = None):
+        self.cache_dir = cache_dir or get_cache_dir()
+        self.max_size = max_size or int(
+            os.environ.get("UELOCTOOL_CACHE_SIZE", DEFAULT_CACHE_SIZE)
+        )
+
+    def get_key(self, input_file: Path, file_handle: BufferedReader) -> str:
+        stat = input_file.stat()
+        content_hash = hashlib.file_digest(file_handle, "blake2b").hexdigest()
+        file_handle.seek(0)
+
+        return hashlib.blake2b(
+            f"{CACHE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}:{content_hash}".encode(),
+            digest_size=20,
+        ).hexdigest()
+
+    def load(self, key: str) -> Handler | None:
+        path = self.cache_dir / f"{key}.pickle"
+
+        # Unpickling creates lots of small objects, pause the GC so it doesn't
+        # keep scanning them while the model is being rebuilt
+        gc_enabled = gc.isenabled()
+        gc.disable()
+
+        try:
+            with open(path, "rb") as file_handle:
+                handler = pickle.load(file_handle)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            warnings.warn(f"Could not read the parse cache: {e}")
+            return None
+        except Exception:
+            # Corrupted or incompatible snapshot, drop it and parse again
+            with suppress(OSError):
+                path.unlink(missing_ok=True)
+
+            return None
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        with suppress(OSError):
+            os.utime(path)  # Mark as recently used
+
+        return handler
+
+    def store(self, key: str, handler: Handler):
+        path = self.cache_dir / f"{key}.pickle"
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+
+        # The parsed handler is already there, a failing cache must not fail the command
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            with open(temp_path, "wb") as file_handle:
+                pickle.dump(handler, file_handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp_path, path)
+            self.evict()
+        except OSError as e:
+            with suppress(OSError):
+                temp_path.unlink(missing_ok=True)
+
+            warnings.warn(f"Could not store the parse cache: {e}")
+
+    def evict(self):
+        entries = []
+
+        for path in self.cache_dir.glob("*.pickle"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                pass
+
+        total_size = sum(stat.st_size for _, stat in entries)
+
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime_ns):
+            if total_size <= self.max_size:
+                break
+
+            path.unlink(missing_ok=True)
+            total_size -= stat.st_size
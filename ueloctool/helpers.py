@@ -1,46 +1,183 @@
-import csv
-import json
+import sys
 from io import BufferedReader
 from pathlib import Path
-
-import polib
+from typing import Iterator
 
 from ueloctool.api.enumerators.data_format import DataFormat
 from ueloctool.api.enumerators.missing_string import MissingStringBehaviour
-from ueloctool.api.formats.locres.main import LocresFile
 from ueloctool.api.handler import Handler
+from ueloctool.api.registry import (
+    HANDLER_SUFFIXES,
+    HEADER_SIZE,
+    detect_format,
+    get_handler_class,
+    get_reader,
+)
+from ueloctool.cache import ParseCache
+from ueloctool.timings import timings
+
+STDIN = Path("-")
+
+
+def get_handler(
+    input_file: Path | None,
+    file_handle: BufferedReader,
+    strings: dict[str, str] | None = None,
+) -> Handler:
+    """
+    Create the handler for a file, detected by its signature or extension.
+
+    `strings` is an intern table for names and keys, callers that keep several
+    parsed files around can share one between them. It grows with every file
+    parsed, so it is owned and dropped by the caller.
+    """
+
+    # The header is read once and handed over to the handler, so detection works
+    # on streams that can't seek back, like stdin or pipes
+    header = file_handle.read(HEADER_SIZE)
 
-AVAILABLE_FORMATS = [LocresFile]
+    if name := detect_format(header):
+        return get_handler_class(name)(file_handle, header=header, strings=strings)
 
+    # Formats without a signature (like legacy locres) are known only by extension
+    if input_file and input_file.suffix in HANDLER_SUFFIXES:
+        format = get_handler_class(HANDLER_SUFFIXES[input_file.suffix])
+        return format(file_handle, allow_legacy=True, header=header, strings=strings)
 
-def get_handler(input_file: Path, file_handle: BufferedReader) -> Handler:
-    handler: Handler = None
+    raise Exception("Could not determine the file format.")
 
-    # Determine the file format
-    if input_file.suffix == ".locres":
-        handler = LocresFile(file_handle, allow_legacy=True)
-    else:
-        # Fallback - we don't know the file format based on the extension
-        # Try all available formats
 
-        for format in AVAILABLE_FORMATS:
-            try:
-                handler = format(file_handle)
-                break
-            except Exception:
-                pass
+def parse_stream(
+    file_handle: BufferedReader, strings: dict[str, str] | None = None
+) -> Handler:
+    """Parse a file from a stream that may not be seekable, e.g. stdin."""
 
-    if handler is None:
-        raise Exception("Could not determine the file format.")
+    with timings.phase("parse"):
+        handler = get_handler(None, file_handle, strings)
+        handler.parse()
 
+    timings.count_handler(handler)
     return handler
 
 
+def parse_file(
+    input_file: Path, use_cache: bool = False, strings: dict[str, str] | None = None
+) -> Handler:
+    if input_file == STDIN:
+        return parse_stream(sys.stdin.buffer, strings)
+
+    cache = ParseCache() if use_cache else None
+
+    with open(input_file, "rb") as file_handle:
+        if cache:
+            with timings.phase("cache_lookup"):
+                cache_key = cache.get_key(input_file, file_handle)
+                handler = cache.load(cache_key)
+
+            if handler:
+                timings.count("cache_hits", 1)
+                timings.count_handler(handler)
+                return handler
+
+        with timings.phase("parse"):
+            handler = get_handler(input_file, file_handle, strings)
+            handler.parse()
+
+    timings.count_file("bytes_read", input_file)
+    timings.count_handler(handler)
+
+    if cache:
+        with timings.phase("cache_store"):
+            cache.store(cache_key, handler)
+
+    return handler
+
+
+def export_file(
+    input_file: Path,
+    output_file: Path | None,
+    output_type: DataFormat,
+    use_cache: bool = False,
+    po_wrap_width: int | None = None,
+):
+    if not output_file and input_file == STDIN:
+        raise Exception("An output file is required when reading from stdin.")
+
+    handler = parse_file(input_file, use_cache)
+
+    if not output_file:
+        output_file = input_file.with_suffix(f".{output_type.value}")
+
+    with timings.phase("export"):
+        handler.export(output_file, output_type, po_wrap_width)
+
+    timings.count_file("bytes_written", output_file)
+
+
+def import_file(
+    original_file: Path,
+    localization_data_file: Path,
+    output_file: Path | None,
+    missing_strings: MissingStringBehaviour,
+    incremental: bool = False,
+    use_cache: bool = False,
+) -> int | None:
+    handler = parse_file(original_file, use_cache)
+    timings.count_file("bytes_read", localization_data_file)
+
+    if not output_file:
+        output_file = original_file
+
+    if incremental:
+        # Only strings present in the language data are touched
+        with timings.phase("patch"):
+            changed = handler.patch_language_data(
+                iter_incremental_data(localization_data_file, missing_strings)
+            )
+
+        if changed or output_file != original_file:
+            with timings.phase("save"):
+                handler.save(output_file)
+
+            timings.count_file("bytes_written", output_file)
+
+        return changed
+
+    with timings.phase("read_language_data"):
+        lang_data = parse_language_data(localization_data_file, missing_strings)
+
+    with timings.phase("apply"):
+        handler.apply_language_data(lang_data, missing_strings)
+
+    with timings.phase("save"):
+        handler.save(output_file)
+
+    timings.count_file("bytes_written", output_file)
+
+
 def parse_language_data(
     input_file: Path, missing_strings: MissingStringBehaviour
 ) -> dict[str, str]:
+    return dict(iter_language_data(input_file, missing_strings))
+
+
+def iter_incremental_data(
+    input_file: Path, missing_strings: MissingStringBehaviour
+) -> Iterator[tuple[str, str]]:
+    # Keys absent from the data keep their current value, and so do the ones
+    # without a translation, there are no missing strings to handle
+    if missing_strings != MissingStringBehaviour.KeyAndOriginal:
+        raise Exception("Missing strings are kept as they are by incremental imports.")
+
+    return iter_language_data(input_file, MissingStringBehaviour.Remove)
+
+
+def iter_language_data(
+    input_file: Path, missing_strings: MissingStringBehaviour
+) -> Iterator[tuple[str, str]]:
     def __get_translated_string(key, original_string, translated_string):
-        # Only for CSV and PO files, JSON files are handled in apply methods
+        # Only for formats storing the source string, JSON files are handled in apply
+        # methods
         if translated_string:
             return translated_string
 
@@ -58,40 +195,16 @@ def parse_language_data(
             case MissingStringBehaviour.Error:
                 raise Exception(f"Missing localized string for {key}")
 
-    data_type = DataFormat(input_file.suffix[1:])
-
-    match data_type:
-        case DataFormat.JSON:
-            with open(input_file, "r", encoding="utf-8") as file_handle:
-                return json.load(file_handle)
-        case DataFormat.CSV:
-            with open(input_file, "r", encoding="utf-8", newline="") as file_handle:
-                reader = csv.DictReader(file_handle)
-                data = {}
-
-                for row in reader:
-                    translated_string = __get_translated_string(
-                        row["Key"], row["SourceString"], row["TranslatedString"]
-                    )
-
-                    if translated_string is None:
-                        continue
-
-                    data[row["Key"]] = translated_string
-
-                return data
-        case DataFormat.PO:
-            po_file = polib.pofile(input_file)
-            data = {}
-
-            for entry in po_file:
-                translated_string = __get_translated_string(
-                    entry.msgctxt, entry.msgid, entry.msgstr
-                )
+    reader = get_reader(DataFormat(input_file.suffix[1:]))
 
-                if translated_string is None:
-                    continue
+    # Entries are yielded as they are read, without loading the whole file first
+    for key, source_string, translated_string in reader(input_file):
+        if source_string is not None:
+            translated_string = __get_translated_string(
+                key, source_string, translated_string
+            )
 
-                data[entry.msgctxt] = translated_string
+            if translated_string is None:
+                continue
 
-            return data
+        yield key, translated_string
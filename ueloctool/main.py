@@ -1,31 +1,110 @@
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Iterable, Optional
 
+import click
 import typer
 
 from ueloctool.api.enumerators.data_format import DataFormat
 from ueloctool.api.enumerators.missing_string import MissingStringBehaviour
-from ueloctool.helpers import get_handler, parse_language_data
+from ueloctool.api.formats.locres.version import LocresVersion
+from ueloctool.timings import timings
+
+if TYPE_CHECKING:
+    from ueloctool.batch import BatchResult
+
+# Modules needed by a single command are imported inside of it, every invocation
+# would pay for them otherwise
 
 app = typer.Typer()
 
+CacheOption = Annotated[
+    bool,
+    typer.Option(help="Reuse and store parsed files in the on-disk parse cache."),
+]
+PipelineOption = Annotated[
+    bool,
+    typer.Option(
+        help="Overlap reading, processing and writing of files, for slow storage."
+    ),
+]
+ConcurrencyOption = Annotated[
+    Optional[int],
+    typer.Option(help="Files in flight at once with --pipeline (default 16)."),
+]
+# Versions are given by name, the enum values are what's stored in the files
+VersionChoice = click.Choice(
+    [version.name for version in LocresVersion], case_sensitive=False
+)
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    show_timings: Annotated[
+        bool,
+        typer.Option("--timings", help="Print the time spent in each phase."),
+    ] = False,
+    timings_json: Annotated[
+        Optional[Path],
+        typer.Option(writable=True, help="Write the timings to a JSON file."),
+    ] = None,
+    profile: Annotated[
+        Optional[Path],
+        typer.Option(writable=True, help="Write cProfile stats of the command."),
+    ] = None,
+):
+    timings.enabled = show_timings or timings_json is not None
+
+    if profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def dump_profile():
+            profiler.disable()
+            profiler.dump_stats(profile)
+
+        ctx.call_on_close(dump_profile)
+
+    if timings.enabled:
+        ctx.call_on_close(lambda: report_timings(show_timings, timings_json))
+
+
+def report_timings(show_timings: bool, timings_json: Path | None):
+    if show_timings:
+        typer.echo(timings.format(), err=True)
+
+    if timings_json:
+        import json
+
+        with open(timings_json, "w", encoding="utf-8") as file_handle:
+            json.dump(timings.as_dict(), file_handle, indent=4)
+
 
 @app.command(name="export")
 def cmd_export(
     input_file: Annotated[
-        Path, typer.Option(exists=True, file_okay=True, readable=True)
+        Path,
+        typer.Option(
+            exists=True,
+            file_okay=True,
+            readable=True,
+            allow_dash=True,
+            help="File to export, - to read it from stdin.",
+        ),
     ],
     output_file: Annotated[Optional[Path], typer.Option(writable=True)] = None,
     output_type: Optional[DataFormat] = DataFormat.JSON,
+    cache: CacheOption = False,
+    po_wrap_width: Annotated[
+        Optional[int],
+        typer.Option(help="Wrap PO lines longer than this (default 78), 0 to disable."),
+    ] = None,
 ):
-    with open(input_file, "rb") as file_handle:
-        handler = get_handler(input_file, file_handle)
-        handler.parse()
-
-    if not output_file:
-        output_file = input_file.with_suffix(f".{output_type.value}")
+    from ueloctool.helpers import export_file
 
-    handler.export(output_file, output_type)
+    export_file(input_file, output_file, output_type, cache, po_wrap_width)
 
 
 @app.command(name="import")
@@ -40,16 +119,507 @@ def cmd_import(
     missing_strings: Optional[
         MissingStringBehaviour
     ] = MissingStringBehaviour.KeyAndOriginal,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            help="Only update strings that changed in the data file. Keys absent "
+            "from it, or without a translation, keep their current value."
+        ),
+    ] = False,
+    cache: CacheOption = False,
+):
+    from ueloctool.helpers import import_file
+
+    check_incremental(incremental, missing_strings)
+    changed = import_file(
+        original_file,
+        localization_data_file,
+        output_file,
+        missing_strings,
+        incremental,
+        cache,
+    )
+
+    if incremental:
+        typer.echo(f"Updated {changed} string(s).")
+
+
+def check_incremental(incremental: bool, missing_strings: MissingStringBehaviour):
+    if incremental and missing_strings != MissingStringBehaviour.KeyAndOriginal:
+        raise typer.BadParameter(
+            "Can't be used with --incremental, strings missing from the data keep "
+            "their current value.",
+            param_hint="--missing-strings",
+        )
+
+
+@app.command(name="get")
+def cmd_get(
+    input_file: Annotated[
+        Path, typer.Option(exists=True, file_okay=True, readable=True)
+    ],
+    key: Annotated[
+        Optional[list[str]], typer.Option(help="Full key (Namespace::Key) to look up.")
+    ] = None,
+    namespace: Annotated[
+        Optional[str], typer.Option(help="Print every string of this namespace.")
+    ] = None,
+):
+    import json
+
+    from ueloctool.api.formats.locres.reader import LocresReader
+
+    result = {}
+
+    # Only the requested strings are decoded, no need to parse the whole file
+    with open(input_file, "rb") as file_handle, LocresReader(file_handle) as reader:
+        for full_key in key or []:
+            result[full_key] = reader.get(full_key)
+
+        if namespace is not None:
+            for full_key in reader.keys(namespace):
+                result[full_key] = reader[full_key]
+
+    typer.echo(json.dumps(result, indent=4, ensure_ascii=False))
+
+
+@app.command(name="diff")
+def cmd_diff(
+    old_file: Annotated[Path, typer.Option(exists=True, file_okay=True, readable=True)],
+    new_file: Annotated[Path, typer.Option(exists=True, file_okay=True, readable=True)],
+    output_file: Annotated[
+        Optional[Path],
+        typer.Option(writable=True, help="Write the changeset here instead of stdout."),
+    ] = None,
 ):
-    with open(original_file, "rb") as file_handle:
-        handler = get_handler(original_file, file_handle)
-        handler.parse()
+    import json
+    from dataclasses import asdict
+
+    from ueloctool.api.formats.locres.diff import diff_locres
+    from ueloctool.api.formats.locres.reader import LocresReader
 
-    lang_data = parse_language_data(localization_data_file, missing_strings)
+    with (
+        open(old_file, "rb") as old_handle,
+        open(new_file, "rb") as new_handle,
+        LocresReader(old_handle) as old,
+        LocresReader(new_handle) as new,
+    ):
+        changeset = diff_locres(old, new)
 
-    handler.apply_language_data(lang_data, missing_strings)
+    if output_file:
+        changeset.save(output_file)
+    else:
+        typer.echo(json.dumps(asdict(changeset), indent=4, ensure_ascii=False))
 
-    if not output_file:
-        output_file = original_file
+    typer.echo(
+        f"Added {len(changeset.added)}, removed {len(changeset.removed)}, "
+        f"changed {len(changeset.changed)} string(s).",
+        err=True,
+    )
 
+
+@app.command(name="prefill")
+def cmd_prefill(
+    changeset_file: Annotated[
+        Path,
+        typer.Option(
+            exists=True, file_okay=True, readable=True, help="Output of the diff."
+        ),
+    ],
+    new_file: Annotated[Path, typer.Option(exists=True, file_okay=True, readable=True)],
+    translated_file: Annotated[
+        Path,
+        typer.Option(
+            exists=True,
+            file_okay=True,
+            readable=True,
+            help="Translated locres file of the old build.",
+        ),
+    ],
+    output_file: Annotated[Path, typer.Option(writable=True)],
+    missing_strings: Optional[
+        MissingStringBehaviour
+    ] = MissingStringBehaviour.KeyAndOriginal,
+    cache: CacheOption = False,
+):
+    from ueloctool.api.formats.locres.diff import Changeset, iter_prefill
+    from ueloctool.api.formats.locres.reader import LocresReader
+    from ueloctool.helpers import parse_file
+
+    changeset = Changeset.load(changeset_file)
+    handler = parse_file(new_file, cache)
+
+    with (
+        open(translated_file, "rb") as file_handle,
+        LocresReader(file_handle) as translations,
+    ):
+        data = dict(iter_prefill(changeset, translations))
+
+    # New and changed strings are missing from the data, and get handled as such
+    handler.apply_language_data(data, missing_strings)
     handler.save(output_file)
+
+    typer.echo(
+        f"Pre-filled {len(data)} string(s), "
+        f"{len(changeset.added) + len(changeset.changed)} need translating."
+    )
+
+
+@app.command(name="split")
+def cmd_split(
+    input_file: Annotated[
+        Path, typer.Option(exists=True, file_okay=True, readable=True)
+    ],
+    output_dir: Annotated[Path, typer.Option(file_okay=False)],
+    max_keys: Annotated[
+        Optional[int],
+        typer.Option(help="Strings per shard. Default: one shard per namespace."),
+    ] = None,
+    output_type: Annotated[
+        Optional[DataFormat],
+        typer.Option(help="Write shards in this format instead of locres."),
+    ] = None,
+):
+    from ueloctool.api.formats.locres.reader import LocresReader
+    from ueloctool.api.formats.locres.shard import split_locres
+
+    with open(input_file, "rb") as file_handle, LocresReader(file_handle) as reader:
+        for shard_file in split_locres(
+            reader, output_dir, input_file.stem, max_keys, output_type
+        ):
+            typer.echo(shard_file)
+
+
+@app.command(name="merge")
+def cmd_merge(
+    input_file: Annotated[
+        list[Path], typer.Option(exists=True, file_okay=True, readable=True)
+    ],
+    output_file: Annotated[Path, typer.Option(writable=True)],
+    version: Annotated[
+        Optional[str],
+        typer.Option(
+            click_type=VersionChoice,
+            help="Locres version of the output. Default: first file.",
+        ),
+    ] = None,
+):
+    from ueloctool.api.formats.locres.shard import merge_locres
+
+    merged, duplicates = merge_locres(
+        input_file, LocresVersion[version] if version else None
+    )
+    merged.save(output_file)
+
+    if duplicates:
+        typer.echo(f"Skipped {duplicates} duplicate key(s).", err=True)
+
+
+@app.command(name="serve")
+def cmd_serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket: Annotated[
+        Optional[Path], typer.Option(help="Listen on this Unix socket instead.")
+    ] = None,
+    root: Annotated[
+        Optional[Path],
+        typer.Option(
+            exists=True,
+            file_okay=False,
+            help="Only serve files in this directory. Default: the current one.",
+        ),
+    ] = None,
+    max_files: Annotated[int, typer.Option(help="Parsed files kept in memory.")] = 16,
+    cache: CacheOption = False,
+):
+    from ueloctool.server import (
+        LocalizationServer,
+        ModelCache,
+        UnixLocalizationServer,
+        remove_socket,
+    )
+
+    models = ModelCache(max_files, cache)
+    root = root or Path.cwd()
+
+    if socket:
+        remove_socket(socket)
+        server = UnixLocalizationServer(str(socket), models, root)
+        typer.echo(f"Listening on {socket}", err=True)
+    else:
+        server = LocalizationServer((host, port), models, root)
+        typer.echo(f"Listening on http://{host}:{server.server_port}", err=True)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+        if socket:
+            remove_socket(socket)
+
+
+def report_batch(results: Iterable["BatchResult"]):
+    processed = 0
+    failed = 0
+
+    for result in results:
+        processed += 1
+
+        if result.error:
+            failed += 1
+            typer.echo(f"[FAIL] {result.file} ({result.elapsed:.3f}s): {result.error}")
+        else:
+            typer.echo(f"[ OK ] {result.file} ({result.elapsed:.3f}s)")
+
+    typer.echo(f"Processed {processed} file(s), {failed} failed.")
+
+    if failed:
+        raise typer.Exit(code=1)
+
+
+def check_pipeline(pipeline: bool, cache: bool):
+    # Workers of the pipeline parse the data they are sent, not files on disk
+    if pipeline and cache:
+        raise typer.BadParameter("Can't be used with --pipeline.", param_hint="--cache")
+
+
+@app.command(name="batch-export")
+def cmd_batch_export(
+    input_path: Annotated[
+        str, typer.Option(help="Directory to search recursively, or a glob pattern.")
+    ],
+    output_dir: Annotated[Optional[Path], typer.Option(file_okay=False)] = None,
+    output_type: Optional[DataFormat] = DataFormat.JSON,
+    cache: CacheOption = False,
+    workers: Optional[int] = None,
+    pipeline: PipelineOption = False,
+    concurrency: ConcurrencyOption = None,
+):
+    from ueloctool.batch import find_files, run_batch
+    from ueloctool.helpers import export_file
+
+    check_pipeline(pipeline, cache)
+
+    base, files = find_files(input_path, ".locres")
+    jobs = []
+
+    for file in files:
+        output_file = None
+
+        if output_dir:
+            output_file = (output_dir / file.relative_to(base)).with_suffix(
+                f".{output_type.value}"
+            )
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        if pipeline:
+            output_file = output_file or file.with_suffix(f".{output_type.value}")
+            jobs.append((file, output_file, output_type))
+        else:
+            jobs.append((file, output_file, output_type, cache))
+
+    if pipeline:
+        from ueloctool.pipeline import export_data, run_pipeline
+
+        report_batch(run_pipeline(export_data, jobs, concurrency, workers))
+    else:
+        report_batch(run_batch(export_file, jobs, workers))
+
+
+@app.command(name="batch-import")
+def cmd_batch_import(
+    input_path: Annotated[
+        str, typer.Option(help="Directory to search recursively, or a glob pattern.")
+    ],
+    localization_data_dir: Annotated[
+        Path, typer.Option(exists=True, file_okay=False, readable=True)
+    ],
+    data_type: Optional[DataFormat] = DataFormat.JSON,
+    output_dir: Annotated[Optional[Path], typer.Option(file_okay=False)] = None,
+    missing_strings: Optional[
+        MissingStringBehaviour
+    ] = MissingStringBehaviour.KeyAndOriginal,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            help="Only update strings that changed in the data files. Keys absent "
+            "from them, or without a translation, keep their current value."
+        ),
+    ] = False,
+    cache: CacheOption = False,
+    workers: Optional[int] = None,
+    pipeline: PipelineOption = False,
+    concurrency: ConcurrencyOption = None,
+):
+    from ueloctool.batch import find_files, run_batch
+    from ueloctool.helpers import import_file
+
+    check_incremental(incremental, missing_strings)
+
+    check_pipeline(pipeline, cache)
+
+    base, files = find_files(input_path, ".locres")
+    jobs = []
+
+    for file in files:
+        relative_path = file.relative_to(base)
+        localization_data_file = (localization_data_dir / relative_path).with_suffix(
+            f".{data_type.value}"
+        )
+        output_file = None
+
+        if output_dir:
+            output_file = output_dir / relative_path
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        if pipeline:
+            jobs.append(
+                (
+                    file,
+                    output_file or file,
+                    localization_data_file,
+                    missing_strings,
+                    incremental,
+                )
+            )
+        else:
+            jobs.append(
+                (
+                    file,
+                    localization_data_file,
+                    output_file,
+                    missing_strings,
+                    incremental,
+                    cache,
+                )
+            )
+
+    if pipeline:
+        from ueloctool.pipeline import import_data, run_pipeline
+
+        report_batch(run_pipeline(import_data, jobs, concurrency, workers))
+    else:
+        report_batch(run_batch(import_file, jobs, workers))
+
+
+@app.command(name="import-many")
+def cmd_import_many(
+    original_file: Annotated[
+        Path, typer.Option(exists=True, file_okay=True, readable=True)
+    ],
+    localization_data_file: Annotated[
+        list[Path],
+        typer.Option(
+            exists=True,
+            file_okay=True,
+            readable=True,
+            help="Language data file, either <lang>.<ext> or <lang>/<name>.<ext>.",
+        ),
+    ],
+    output_dir: Annotated[Path, typer.Option(file_okay=False)],
+    missing_strings: Optional[
+        MissingStringBehaviour
+    ] = MissingStringBehaviour.KeyAndOriginal,
+    cache: CacheOption = False,
+    workers: Optional[int] = None,
+):
+    from ueloctool.batch import (
+        apply_shared_language_data,
+        init_shared_handler,
+        run_batch,
+    )
+    from ueloctool.helpers import parse_file
+
+    # The original file is parsed once and shared by all languages
+    handler = parse_file(original_file, cache)
+    jobs = []
+
+    for data_file in localization_data_file:
+        if data_file.stem == original_file.stem:
+            language = data_file.parent.name
+        else:
+            language = data_file.stem
+
+        jobs.append(
+            (data_file, output_dir / language / original_file.name, missing_strings)
+        )
+
+    report_batch(
+        run_batch(
+            apply_shared_language_data,
+            jobs,
+            workers,
+            initializer=init_shared_handler,
+            initargs=(handler,),
+        )
+    )
+
+
+@app.command(name="benchmark")
+def cmd_benchmark(
+    version: Annotated[
+        Optional[list[str]],
+        typer.Option(
+            click_type=VersionChoice,
+            help="Locres version(s) to benchmark. Default: all.",
+        ),
+    ] = None,
+    namespaces: int = 10,
+    keys: Annotated[int, typer.Option(help="Number of keys per namespace.")] = 1000,
+    duplicate_ratio: float = 0.2,
+    utf16_ratio: float = 0.1,
+    repeat: int = 3,
+    baseline: Annotated[
+        Optional[Path], typer.Option(help="JSON file with timings to compare against.")
+    ] = None,
+    save_baseline: Annotated[
+        bool, typer.Option(help="Store the timings as the new baseline.")
+    ] = False,
+    tolerance: Annotated[
+        float, typer.Option(help="Allowed slowdown over the baseline (0.2 = 20%).")
+    ] = 0.2,
+):
+    from ueloctool.benchmark import (
+        find_regressions,
+        load_baseline,
+        run_benchmarks,
+        write_baseline,
+    )
+
+    versions = [LocresVersion[name] for name in version] if version else LocresVersion
+    parameters = {
+        "namespaces": namespaces,
+        "keys": keys,
+        "duplicate_ratio": duplicate_ratio,
+        "utf16_ratio": utf16_ratio,
+    }
+
+    baseline_results = {}
+
+    if baseline and baseline.exists() and not save_baseline:
+        baseline_results = load_baseline(baseline, parameters)
+
+    results = run_benchmarks(versions, parameters, repeat)
+    regressions = []
+
+    for group, group_results in results.items():
+        slower = find_regressions(
+            group_results, baseline_results.get(group, {}), tolerance
+        )
+
+        for name, elapsed in group_results.items():
+            marker = " (REGRESSION)" if name in slower else ""
+            typer.echo(f"{group:<28} {name:<12} {elapsed * 1000:10.2f} ms{marker}")
+
+        regressions.extend(f"{group} {name}" for name in slower)
+
+    if baseline and save_baseline:
+        write_baseline(baseline, parameters, results)
+
+    if regressions:
+        typer.echo(f"Regressed: {', '.join(regressions)}")
+        raise typer.Exit(code=1)
@@ -0,0 +1,179 @@
+import asyncio
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import AsyncIterator, Callable, Iterator
+
+from ueloctool.api.enumerators.data_format import DataFormat
+from ueloctool.api.enumerators.missing_string import MissingStringBehaviour
+from ueloctool.batch import BatchResult
+from ueloctool.helpers import get_handler, iter_incremental_data, parse_language_data
+
+DEFAULT_CONCURRENCY = 16
+
+
+def export_data(
+    input_file: Path,
+    data: bytes,
+    output_file: Path,
+    output_type: DataFormat,
+    po_wrap_width: int | None = None,
+):
+    handler = get_handler(input_file, BytesIO(data))
+    handler.parse()
+    handler.export(output_file, output_type, po_wrap_width)
+
+
+def import_data(
+    input_file: Path,
+    data: bytes,
+    output_file: Path,
+    localization_data_file: Path,
+    missing_strings: MissingStringBehaviour,
+    incremental: bool = False,
+):
+    handler = get_handler(input_file, BytesIO(data))
+    handler.parse()
+
+    if incremental:
+        handler.patch_language_data(
+            iter_incremental_data(localization_data_file, missing_strings)
+        )
+    else:
+        handler.apply_language_data(
+            parse_language_data(localization_data_file, missing_strings),
+            missing_strings,
+        )
+
+    handler.save(output_file)
+
+
+def _move(source: Path, destination: Path):
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    shutil.move(source, destination)
+
+
+def _failed(file: Path, start: float, e: Exception) -> BatchResult:
+    return BatchResult(file, time.perf_counter() - start, f"{type(e).__name__}: {e}")
+
+
+async def iter_pipeline(
+    func: Callable,
+    jobs: list[tuple],
+    concurrency: int | None = None,
+    workers: int | None = None,
+) -> AsyncIterator[BatchResult]:
+    """
+    Run `func(input_file, data, temp_file, *args)` for every
+    `(input_file, output_file, *args)` job, yielding results as they finish.
+
+    Reading, processing and writing of different files overlap: inputs are
+    prefetched by `concurrency` readers, processed on a pool of `workers`
+    processes into a local temporary file and moved to the output by
+    `concurrency` writers. At most `concurrency` inputs are held in memory, from
+    the start of their read until they're processed, plus a pickled copy of
+    each one being processed in a worker.
+    """
+
+    loop = asyncio.get_running_loop()
+    concurrency = concurrency or DEFAULT_CONCURRENCY
+    workers = workers or os.cpu_count() or 1
+    pending = iter(enumerate(jobs))
+    in_flight = asyncio.Semaphore(concurrency)
+    read_queue = asyncio.Queue(maxsize=concurrency)
+    write_queue = asyncio.Queue(maxsize=concurrency)
+    results = asyncio.Queue()
+
+    with (
+        TemporaryDirectory() as temp_dir,
+        ProcessPoolExecutor(max_workers=workers) as executor,
+    ):
+
+        async def read():
+            # Readers share the jobs iterator, each job is taken exactly once
+            for index, job in pending:
+                await in_flight.acquire()
+                start = time.perf_counter()
+
+                try:
+                    data = await asyncio.to_thread(job[0].read_bytes)
+                except Exception as e:
+                    in_flight.release()
+                    await results.put(_failed(job[0], start, e))
+                    continue
+
+                await read_queue.put((index, job, data, start))
+
+        async def process():
+            while (item := await read_queue.get()) is not None:
+                index, job, data, start = item
+                temp_file = Path(temp_dir) / str(index)
+                del item
+
+                try:
+                    await loop.run_in_executor(
+                        executor, func, job[0], data, temp_file, *job[2:]
+                    )
+                except Exception as e:
+                    await results.put(_failed(job[0], start, e))
+                    continue
+                finally:
+                    # Only the temporary file is left, let the next input be read
+                    del data
+                    in_flight.release()
+
+                await write_queue.put((job, temp_file, start))
+
+        async def write():
+            while (item := await write_queue.get()) is not None:
+                job, temp_file, start = item
+
+                try:
+                    await asyncio.to_thread(_move, temp_file, job[1])
+                except Exception as e:
+                    await results.put(_failed(job[0], start, e))
+                    continue
+
+                await results.put(BatchResult(job[0], time.perf_counter() - start))
+
+        async def close(tasks: list[asyncio.Task], queue: asyncio.Queue, count: int):
+            # Once a stage is done, tell every consumer of the next one to stop
+            await asyncio.gather(*tasks)
+
+            for _ in range(count):
+                await queue.put(None)
+
+        async with asyncio.TaskGroup() as group:
+            readers = [group.create_task(read()) for _ in range(concurrency)]
+            processors = [group.create_task(process()) for _ in range(workers)]
+            writers = [group.create_task(write()) for _ in range(concurrency)]
+
+            group.create_task(close(readers, read_queue, len(processors)))
+            group.create_task(close(processors, write_queue, len(writers)))
+
+            for _ in jobs:
+                yield await results.get()
+
+
+def run_pipeline(
+    func: Callable,
+    jobs: list[tuple],
+    concurrency: int | None = None,
+    workers: int | None = None,
+) -> Iterator[BatchResult]:
+    """Synchronous wrapper of `iter_pipeline`, for callers outside of an event loop."""
+
+    async def get_next(results: AsyncIterator[BatchResult]) -> BatchResult | None:
+        return await anext(results, None)
+
+    with asyncio.Runner() as runner:
+        results = iter_pipeline(func, jobs, concurrency, workers)
+
+        # The event loop only runs while waiting for the next result, pending stages
+        # carry on from where they were on the next call
+        while (result := runner.run(get_next(results))) is not None:
+            yield result
@@ -0,0 +1,272 @@
+import copy
+import json
+import os
+import socketserver
+import stat
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Callable
+from urllib.parse import parse_qs, urlsplit
+
+from ueloctool.api.enumerators.missing_string import MissingStringBehaviour
+from ueloctool.api.handler import Handler
+from ueloctool.helpers import parse_file
+
+DEFAULT_MAX_FILES = 16
+
+
+class ModelCache:
+    """
+    Parsed files kept in memory between requests.
+
+    An entry is parsed again once the size or mtime of its file changes, the
+    least recently used ones are dropped past `max_files`. Cached files share
+    an intern table for their names and keys, it is started over whenever an
+    entry is dropped so it doesn't outgrow the cache.
+    """
+
+    def __init__(self, max_files: int = DEFAULT_MAX_FILES, use_cache: bool = False):
+        self.max_files = max_files
+        self.use_cache = use_cache
+        self.entries: OrderedDict[Path, tuple[int, int, Handler]] = OrderedDict()
+        self.strings: dict[str, str] = {}
+
+    def get(self, file: Path) -> Handler:
+        stat = file.stat()
+        entry = self.entries.get(file)
+
+        if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            self.entries.move_to_end(file)
+            return entry[2]
+
+        handler = parse_file(file, self.use_cache, self.strings)
+        self.put(file, handler, stat)
+        return handler
+
+    def put(self, file: Path, handler: Handler, stat: os.stat_result | None = None):
+        stat = stat or file.stat()
+        self.entries[file] = (stat.st_mtime_ns, stat.st_size, handler)
+        self.entries.move_to_end(file)
+
+        while len(self.entries) > self.max_files:
+            self.entries.popitem(last=False)
+            self.strings = {}
+
+    def discard(self, file: Path):
+        if self.entries.pop(file, None):
+            self.strings = {}
+
+
+class RequestError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON API over the parsed files of a `ModelCache`.
+
+    GET  /get?file=...&key=...&namespace=...   Look up keys or a whole namespace.
+    POST /get    {"file", "keys", "namespace"}  Same, for bulk queries.
+    POST /apply  {"file", "data", "missing_strings", "incremental", "output_file"}
+                 Apply language data and save, in place unless `output_file` is set.
+
+    Paths are relative to the root directory of the server and can't reach
+    outside of it. POST bodies must be sent as application/json, and over TCP
+    the Host header must name the address the server is bound to, so web pages
+    can't send requests to it from a browser.
+    """
+
+    server: "LocalizationServer | UnixLocalizationServer"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+
+        self.dispatch(
+            url.path,
+            lambda: {
+                "file": query.get("file", [None])[0],
+                "keys": query.get("key", []),
+                "namespace": query.get("namespace", [None])[0],
+            },
+        )
+
+    def do_POST(self):
+        self.dispatch(urlsplit(self.path).path, self.read_json)
+
+    def read_json(self) -> dict:
+        # Browsers send other content types cross-origin without asking first
+        if self.headers.get_content_type() != "application/json":
+            raise RequestError(
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                "Content-Type must be application/json.",
+            )
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Invalid JSON body.")
+
+        if not isinstance(request, dict):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Expected a JSON object.")
+
+        return request
+
+    def dispatch(self, path: str, read_request: Callable[[], dict]):
+        try:
+            allowed_hosts = self.server.allowed_hosts
+
+            # Guards against DNS rebinding, a page's own host name resolving to us
+            if allowed_hosts is not None and self.headers["Host"] not in allowed_hosts:
+                raise RequestError(HTTPStatus.FORBIDDEN, "Invalid Host header.")
+
+            request = read_request()
+
+            match path:
+                case "/get":
+                    response = self.get_strings(request)
+                case "/apply":
+                    response = self.apply(request)
+                case _:
+                    raise RequestError(HTTPStatus.NOT_FOUND, f"Unknown endpoint {path}")
+        except RequestError as e:
+            self.respond(e.status, {"error": str(e)})
+        except FileNotFoundError as e:
+            self.respond(HTTPStatus.NOT_FOUND, {"error": str(e)})
+        except Exception as e:
+            self.respond(HTTPStatus.BAD_REQUEST, {"error": f"{type(e).__name__}: {e}"})
+        else:
+            self.respond(HTTPStatus.OK, response)
+
+    def get_file(self, request: dict, field: str = "file") -> Path:
+        if not request.get(field):
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Missing '{field}'.")
+
+        # Resolved first, so neither '..' nor symlinks can lead outside of the root
+        root = self.server.root
+        file = (root / request[field]).resolve()
+
+        if not file.is_relative_to(root):
+            raise RequestError(
+                HTTPStatus.FORBIDDEN, f"'{field}' is outside of the served directory."
+            )
+
+        return file
+
+    def get_strings(self, request: dict) -> dict[str, str | None]:
+        handler = self.server.models.get(self.get_file(request))
+        result = {key: handler.get(key) for key in request.get("keys") or []}
+
+        if request.get("namespace") is not None:
+            for key in handler.keys(request["namespace"]):
+                result[key] = handler.get(key)
+
+        return result
+
+    def apply(self, request: dict) -> dict[str, int | None]:
+        file = self.get_file(request)
+        output_file = (
+            self.get_file(request, "output_file")
+            if request.get("output_file")
+            else file
+        )
+        data = request.get("data") or {}
+        handler = self.server.models.get(file)
+        changed = None
+
+        missing_strings = MissingStringBehaviour(
+            request.get("missing_strings", MissingStringBehaviour.KeyAndOriginal)
+        )
+
+        if request.get("incremental"):
+            # Patching changes the cached model itself, so it has to match the file
+            if output_file != file:
+                raise RequestError(
+                    HTTPStatus.BAD_REQUEST, "Incremental updates are saved in place."
+                )
+
+            if missing_strings != MissingStringBehaviour.KeyAndOriginal:
+                raise RequestError(
+                    HTTPStatus.BAD_REQUEST,
+                    "Missing strings are kept as they are by incremental updates.",
+                )
+
+            try:
+                changed = handler.patch_language_data(data.items())
+
+                if changed:
+                    handler.save(output_file)
+            except Exception:
+                # The cached model may not match the file anymore
+                self.server.models.discard(file)
+                raise
+        else:
+            # Applying replaces the model of the copy, the cached one stays intact
+            handler = copy.copy(handler)
+            handler.apply_language_data(data, missing_strings)
+            handler.save(output_file)
+
+        # The saved model is what's on disk now, no need to parse it again
+        self.server.models.put(output_file, handler)
+        return {"changed": changed}
+
+    def respond(self, status: HTTPStatus, body: dict):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args):
+        # Lookups are frequent, don't spend time on logging every one of them
+        pass
+
+
+class LocalizationServer(HTTPServer):
+    # Requests are served one at a time, models are never touched concurrently
+    def __init__(self, address: tuple[str, int], models: ModelCache, root: Path):
+        super().__init__(address, RequestHandler)
+        self.models = models
+        self.root = root.resolve()
+
+        host, port = self.server_address[:2]
+        self.allowed_hosts = {f"{host}:{port}"}
+
+        if host == "127.0.0.1":
+            self.allowed_hosts.add(f"localhost:{port}")
+
+
+class UnixLocalizationServer(socketserver.UnixStreamServer):
+    # Browsers can't connect to Unix sockets, the file permissions guard access
+    allowed_hosts = None
+
+    def __init__(self, path: str, models: ModelCache, root: Path):
+        super().__init__(path, RequestHandler)
+        self.models = models
+        self.root = root.resolve()
+
+    def get_request(self):
+        # Unix sockets have no client address, the request handler expects one
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+def remove_socket(path: Path):
+    """Remove a Unix socket left behind by a server, refusing to delete anything else."""
+
+    try:
+        mode = path.lstat().st_mode
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(mode):
+        raise Exception(f"{path} already exists and is not a socket.")
+
+    path.unlink()
@@ -0,0 +1,84 @@
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from ueloctool.api.handler import Handler
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+
+@dataclass
+class Timings:
+    """
+    Wall time of the phases of a command, together with counters like bytes read.
+
+    Attributes:
+        enabled: Whether the more expensive statistics (e.g. key counts) are collected.
+        phases: Total wall time in seconds of every phase, in the order they first ran.
+        counters: Named counters, e.g. bytes read or the number of keys.
+    """
+
+    enabled: bool = False
+    phases: dict[str, float] = field(default_factory=lambda: {})
+    counters: dict[str, int] = field(default_factory=lambda: {})
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def count(self, name: str, value: int):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def count_file(self, name: str, path: Path):
+        if self.enabled:
+            self.count(name, path.stat().st_size)
+
+    def count_handler(self, handler: Handler):
+        if self.enabled:
+            for name, value in handler.get_stats().items():
+                self.count(name, value)
+
+    def as_dict(self) -> dict:
+        return {
+            "phases": self.phases,
+            "counters": self.counters,
+            "peak_rss_bytes": get_peak_rss(),
+        }
+
+    def format(self) -> str:
+        lines = [
+            f"{name:<24} {elapsed * 1000:10.2f} ms"
+            for name, elapsed in self.phases.items()
+        ]
+        lines += [f"{name:<24} {value:>13}" for name, value in self.counters.items()]
+
+        if (peak_rss := get_peak_rss()) is not None:
+            lines.append(f"{'peak_rss_bytes':<24} {peak_rss:>13}")
+
+        return "\n".join(lines)
+
+
+def get_peak_rss() -> int | None:
+    if resource is None:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Reported in bytes on macOS, in kilobytes everywhere else
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+timings = Timings()